@@ -8,49 +8,50 @@ validation and help text generation.
 
 import argparse
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from typing import Sequence
 
 from pdf2markdown.core.config import ApplicationConfig
+from pdf2markdown.core.exceptions import ErrorCode
 from pdf2markdown.core.exceptions import ValidationError
 
 
+@dataclass(frozen=True)
 class CliArguments:
     """Value object containing parsed command-line arguments.
     
     This immutable data structure holds validated command-line arguments
     with proper type conversion and default value handling.
+
+    Attributes:
+        input_file: Path to input PDF file
+        output_file: Path to output Markdown file (defaults to input with .md)
+        debug: Enable debug mode with verbose output
+        verbose: Enable verbose output (implied by debug)
+        quiet: Suppress non-error output
+        force: Overwrite existing output files
+
+    Raises:
+        ValidationError: If argument combination is invalid
     """
 
-    def __init__(
-        self,
-        input_file: Path,
-        output_file: Optional[Path] = None,
-        debug: bool = False,
-        verbose: bool = False,
-        quiet: bool = False,
-        force: bool = False
-    ) -> None:
-        """Initialize CLI arguments with validation.
-        
-        Args:
-            input_file: Path to input PDF file
-            output_file: Optional path to output Markdown file
-            debug: Enable debug mode with verbose output
-            verbose: Enable verbose output
-            quiet: Suppress non-error output
-            force: Overwrite existing output files
-            
-        Raises:
-            ValidationError: If argument combination is invalid
-        """
-        self.input_file = input_file
-        self.output_file = output_file or self._generate_output_path(input_file)
-        self.debug = debug
-        self.verbose = verbose or debug  # Debug implies verbose
-        self.quiet = quiet
-        self.force = force
+    input_file: Path
+    output_file: Optional[Path] = None
+    debug: bool = False
+    verbose: bool = False
+    quiet: bool = False
+    force: bool = False
+
+    def __post_init__(self) -> None:
+        """Fill in derived values and validate the argument combination."""
+        if self.output_file is None:
+            object.__setattr__(self, 'output_file', self._generate_output_path(self.input_file))
+
+        # Debug implies verbose
+        object.__setattr__(self, 'verbose', self.verbose or self.debug)
 
         self._validate()
 
@@ -74,13 +75,15 @@ class CliArguments:
         if self.verbose and self.quiet:
             raise ValidationError(
                 "Cannot specify both --verbose and --quiet options",
-                field="output_mode"
+                field="output_mode",
+                code=ErrorCode.CONFLICTING_OPTIONS
             )
 
         if not self.input_file.suffix.lower() == '.pdf':
             raise ValidationError(
                 f"Input file must have .pdf extension: {self.input_file}",
-                field="input_file"
+                field="input_file",
+                code=ErrorCode.INVALID_EXTENSION
             )
 
     def to_dict(self) -> dict:
@@ -279,9 +282,15 @@ class ArgumentParser:
         )
 
 
+@lru_cache(maxsize=8)
 def create_argument_parser(config: ApplicationConfig) -> ArgumentParser:
     """Factory function to create configured argument parser.
     
+    Parsers are cached per (frozen, hashable) configuration, so repeated
+    calls with an equal config return the same instance. Callers must not
+    modify the returned parser; use create_argument_parser.cache_clear()
+    to force a rebuild.
+
     Args:
         config: Application configuration
         
@@ -10,11 +10,18 @@ import os
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
+from typing import FrozenSet
+from typing import Mapping
 from typing import Optional
 
 from pdf2markdown.core.exceptions import ConfigurationError
+from pdf2markdown.core.exceptions import ErrorCode
 from pdf2markdown.core.exceptions import ValidationError
 
+# Allowed values for validated string settings
+_VALID_DIALECTS: FrozenSet[str] = frozenset({"gfm", "commonmark", "basic"})
+_VALID_LEVELS: FrozenSet[str] = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
 
 @dataclass(frozen=True)
 class ListDetectionConfig:
@@ -45,19 +52,22 @@ class ListDetectionConfig:
         if self.indentation_threshold <= 0:
             raise ValidationError(
                 "indentation_threshold must be positive",
-                field="indentation_threshold"
+                field="indentation_threshold",
+                code=ErrorCode.POSITIVE_REQUIRED
             )
 
         if self.continuation_indent_threshold <= 0:
             raise ValidationError(
                 "continuation_indent_threshold must be positive",
-                field="continuation_indent_threshold"
+                field="continuation_indent_threshold",
+                code=ErrorCode.POSITIVE_REQUIRED
             )
 
         if not 0 <= self.max_nesting_level <= 3:
             raise ValidationError(
                 "max_nesting_level must be between 0 and 3",
-                field="max_nesting_level"
+                field="max_nesting_level",
+                code=ErrorCode.OUT_OF_RANGE
             )
 
 
@@ -98,32 +108,36 @@ class ProcessingConfig:
         if self.max_file_size_mb <= 0:
             raise ValidationError(
                 "max_file_size_mb must be positive",
-                field="max_file_size_mb"
+                field="max_file_size_mb",
+                code=ErrorCode.POSITIVE_REQUIRED
             )
 
         if self.processing_timeout_seconds <= 0:
             raise ValidationError(
                 "processing_timeout_seconds must be positive",
-                field="processing_timeout_seconds"
+                field="processing_timeout_seconds",
+                code=ErrorCode.POSITIVE_REQUIRED
             )
 
         if self.memory_limit_mb <= 0:
             raise ValidationError(
                 "memory_limit_mb must be positive",
-                field="memory_limit_mb"
+                field="memory_limit_mb",
+                code=ErrorCode.POSITIVE_REQUIRED
             )
 
-        valid_dialects = {"gfm", "commonmark", "basic"}
-        if self.markdown_dialect not in valid_dialects:
+        if self.markdown_dialect not in _VALID_DIALECTS:
             raise ValidationError(
-                f"markdown_dialect must be one of {valid_dialects}",
-                field="markdown_dialect"
+                f"markdown_dialect must be one of {set(_VALID_DIALECTS)}",
+                field="markdown_dialect",
+                code=ErrorCode.INVALID_CHOICE
             )
 
         if self.line_length <= 0:
             raise ValidationError(
                 "line_length must be positive",
-                field="line_length"
+                field="line_length",
+                code=ErrorCode.POSITIVE_REQUIRED
             )
 
 
@@ -152,23 +166,25 @@ class LoggingConfig:
         Raises:
             ValidationError: If any logging configuration value is invalid
         """
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if self.level.upper() not in valid_levels:
+        if self.level.upper() not in _VALID_LEVELS:
             raise ValidationError(
-                f"Logging level must be one of {valid_levels}",
-                field="level"
+                f"Logging level must be one of {set(_VALID_LEVELS)}",
+                field="level",
+                code=ErrorCode.INVALID_CHOICE
             )
 
         if self.enable_file_logging and not self.log_file_path:
             raise ValidationError(
                 "log_file_path is required when file logging is enabled",
-                field="log_file_path"
+                field="log_file_path",
+                code=ErrorCode.REQUIRED
             )
 
         if self.max_log_file_size_mb <= 0:
             raise ValidationError(
                 "max_log_file_size_mb must be positive",
-                field="max_log_file_size_mb"
+                field="max_log_file_size_mb",
+                code=ErrorCode.POSITIVE_REQUIRED
             )
 
 
@@ -244,7 +260,7 @@ class ConfigurationManager:
     def __init__(self) -> None:
         """Initialize configuration manager."""
         if self._config is None:
-            self._config = self._load_configuration()
+            self._config = self.load_configuration()
 
     def get_config(self) -> ApplicationConfig:
         """Get the current application configuration.
@@ -253,57 +269,67 @@ class ConfigurationManager:
             Current application configuration instance
         """
         if self._config is None:
-            self._config = self._load_configuration()
+            self._config = self.load_configuration()
         return self._config
 
-    def _load_configuration(self) -> ApplicationConfig:
-        """Load configuration from environment and defaults.
+    def load_configuration(self, env: Optional[Mapping[str, str]] = None) -> ApplicationConfig:
+        """Build a configuration from an environment mapping and defaults.
+
+        Unlike get_config, this neither reads nor updates the cached
+        singleton configuration, so any mapping can be loaded at any time.
         
+        Args:
+            env: Mapping to read settings from (defaults to os.environ)
+
         Returns:
             Loaded and validated application configuration
             
         Raises:
             ConfigurationError: If configuration loading fails
         """
+        if env is None:
+            # Snapshot once so every setting is read from one consistent plain dict
+            env = dict(os.environ)
+
         try:
             # Load processing configuration
             processing_config = ProcessingConfig(
-                max_file_size_mb=self._get_env_int("PDF2MD_MAX_FILE_SIZE_MB", 100),
-                processing_timeout_seconds=self._get_env_int("PDF2MD_TIMEOUT", 300),
-                memory_limit_mb=self._get_env_int("PDF2MD_MEMORY_LIMIT_MB", 512),
-                extract_tables=self._get_env_bool("PDF2MD_EXTRACT_TABLES", True),
-                extract_images=self._get_env_bool("PDF2MD_EXTRACT_IMAGES", False),
-                preserve_formatting=self._get_env_bool("PDF2MD_PRESERVE_FORMATTING", True),
-                markdown_dialect=os.getenv("PDF2MD_MARKDOWN_DIALECT", "gfm"),
-                include_metadata=self._get_env_bool("PDF2MD_INCLUDE_METADATA", True),
-                wrap_long_lines=self._get_env_bool("PDF2MD_WRAP_LINES", True),
-                line_length=self._get_env_int("PDF2MD_LINE_LENGTH", 80),
+                max_file_size_mb=self._get_env_int(env, "PDF2MD_MAX_FILE_SIZE_MB", 100),
+                processing_timeout_seconds=self._get_env_int(env, "PDF2MD_TIMEOUT", 300),
+                memory_limit_mb=self._get_env_int(env, "PDF2MD_MEMORY_LIMIT_MB", 512),
+                extract_tables=self._get_env_bool(env, "PDF2MD_EXTRACT_TABLES", True),
+                extract_images=self._get_env_bool(env, "PDF2MD_EXTRACT_IMAGES", False),
+                preserve_formatting=self._get_env_bool(env, "PDF2MD_PRESERVE_FORMATTING", True),
+                markdown_dialect=env.get("PDF2MD_MARKDOWN_DIALECT", "gfm"),
+                include_metadata=self._get_env_bool(env, "PDF2MD_INCLUDE_METADATA", True),
+                wrap_long_lines=self._get_env_bool(env, "PDF2MD_WRAP_LINES", True),
+                line_length=self._get_env_int(env, "PDF2MD_LINE_LENGTH", 80),
             )
 
             # Load logging configuration
             logging_config = LoggingConfig(
-                level=os.getenv("PDF2MD_LOG_LEVEL", "INFO").upper(),
-                enable_file_logging=self._get_env_bool("PDF2MD_FILE_LOGGING", False),
-                log_file_path=os.getenv("PDF2MD_LOG_FILE"),
-                max_log_file_size_mb=self._get_env_int("PDF2MD_LOG_FILE_SIZE_MB", 10),
-                backup_count=self._get_env_int("PDF2MD_LOG_BACKUP_COUNT", 3),
+                level=env.get("PDF2MD_LOG_LEVEL", "INFO").upper(),
+                enable_file_logging=self._get_env_bool(env, "PDF2MD_FILE_LOGGING", False),
+                log_file_path=env.get("PDF2MD_LOG_FILE"),
+                max_log_file_size_mb=self._get_env_int(env, "PDF2MD_LOG_FILE_SIZE_MB", 10),
+                backup_count=self._get_env_int(env, "PDF2MD_LOG_BACKUP_COUNT", 3),
             )
 
             # Load list detection configuration
             list_detection_config = ListDetectionConfig(
-                indentation_threshold=self._get_env_float("PDF2MD_LIST_INDENT_THRESHOLD", 10.0),
-                continuation_indent_threshold=self._get_env_float("PDF2MD_LIST_CONTINUATION_THRESHOLD", 5.0),
-                max_nesting_level=self._get_env_int("PDF2MD_LIST_MAX_NESTING", 3),
-                enable_bullet_detection=self._get_env_bool("PDF2MD_LIST_ENABLE_BULLETS", True),
-                enable_numbered_detection=self._get_env_bool("PDF2MD_LIST_ENABLE_NUMBERED", True),
-                enable_alphabetic_detection=self._get_env_bool("PDF2MD_LIST_ENABLE_ALPHABETIC", True),
-                enable_roman_detection=self._get_env_bool("PDF2MD_LIST_ENABLE_ROMAN", True),
-                enable_parenthetical_detection=self._get_env_bool("PDF2MD_LIST_ENABLE_PARENTHETICAL", True),
+                indentation_threshold=self._get_env_float(env, "PDF2MD_LIST_INDENT_THRESHOLD", 10.0),
+                continuation_indent_threshold=self._get_env_float(env, "PDF2MD_LIST_CONTINUATION_THRESHOLD", 5.0),
+                max_nesting_level=self._get_env_int(env, "PDF2MD_LIST_MAX_NESTING", 3),
+                enable_bullet_detection=self._get_env_bool(env, "PDF2MD_LIST_ENABLE_BULLETS", True),
+                enable_numbered_detection=self._get_env_bool(env, "PDF2MD_LIST_ENABLE_NUMBERED", True),
+                enable_alphabetic_detection=self._get_env_bool(env, "PDF2MD_LIST_ENABLE_ALPHABETIC", True),
+                enable_roman_detection=self._get_env_bool(env, "PDF2MD_LIST_ENABLE_ROMAN", True),
+                enable_parenthetical_detection=self._get_env_bool(env, "PDF2MD_LIST_ENABLE_PARENTHETICAL", True),
             )
 
             # Create main configuration
             config = ApplicationConfig(
-                debug=self._get_env_bool("PDF2MD_DEBUG", False),
+                debug=self._get_env_bool(env, "PDF2MD_DEBUG", False),
                 processing=processing_config,
                 logging=logging_config,
                 list_detection=list_detection_config,
@@ -314,10 +340,11 @@ class ConfigurationManager:
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration: {e}") from e
 
-    def _get_env_float(self, key: str, default: float) -> float:
+    def _get_env_float(self, env: Mapping[str, str], key: str, default: float) -> float:
         """Get float value from environment with fallback.
         
         Args:
+            env: Environment mapping to read from
             key: Environment variable name
             default: Default value if not found or invalid
             
@@ -325,15 +352,16 @@ class ConfigurationManager:
             Float value from environment or default
         """
         try:
-            value = os.getenv(key)
+            value = env.get(key)
             return float(value) if value is not None else default
         except (ValueError, TypeError):
             return default
 
-    def _get_env_int(self, key: str, default: int) -> int:
+    def _get_env_int(self, env: Mapping[str, str], key: str, default: int) -> int:
         """Get integer value from environment with fallback.
         
         Args:
+            env: Environment mapping to read from
             key: Environment variable name
             default: Default value if not found or invalid
             
@@ -341,22 +369,23 @@ class ConfigurationManager:
             Integer value from environment or default
         """
         try:
-            value = os.getenv(key)
+            value = env.get(key)
             return int(value) if value is not None else default
         except (ValueError, TypeError):
             return default
 
-    def _get_env_bool(self, key: str, default: bool) -> bool:
+    def _get_env_bool(self, env: Mapping[str, str], key: str, default: bool) -> bool:
         """Get boolean value from environment with fallback.
         
         Args:
+            env: Environment mapping to read from
             key: Environment variable name
             default: Default value if not found or invalid
             
         Returns:
             Boolean value from environment or default
         """
-        value = os.getenv(key, "").lower()
+        value = env.get(key, "").lower()
         if value in ("true", "1", "yes", "on"):
             return True
         elif value in ("false", "0", "no", "off"):
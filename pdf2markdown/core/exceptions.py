@@ -5,6 +5,7 @@ This module defines the exception hierarchy used throughout the application,
 following enterprise security and error handling best practices.
 """
 
+from enum import Enum
 from typing import Optional
 
 
@@ -39,6 +40,17 @@ class PdfToMarkdownError(Exception):
         return self.message
 
 
+class ErrorCode(Enum):
+    """Machine-checkable reasons for a validation failure."""
+
+    POSITIVE_REQUIRED = "positive_required"
+    OUT_OF_RANGE = "out_of_range"
+    INVALID_CHOICE = "invalid_choice"
+    REQUIRED = "required"
+    CONFLICTING_OPTIONS = "conflicting_options"
+    INVALID_EXTENSION = "invalid_extension"
+
+
 class ValidationError(PdfToMarkdownError):
     """Raised when input validation fails.
     
@@ -47,15 +59,22 @@ class ValidationError(PdfToMarkdownError):
     malformed configuration.
     """
 
-    def __init__(self, message: str, field: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        field: Optional[str] = None,
+        code: Optional[ErrorCode] = None
+    ) -> None:
         """Initialize validation error with field information.
         
         Args:
             message: Validation error description
             field: Optional field name that failed validation
+            code: Optional structured reason for the failure
         """
         details = {"field": field} if field else {}
         super().__init__(message, "VALIDATION_ERROR", details)
+        self.code = code
 
 
 class InvalidPdfError(PdfToMarkdownError):
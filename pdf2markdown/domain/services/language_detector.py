@@ -8,23 +8,208 @@ import re
 from collections import Counter
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import replace
+from types import MappingProxyType
 from typing import Dict
+from typing import FrozenSet
 from typing import List
+from typing import Mapping
 from typing import Optional
-from typing import Set
+from typing import Pattern
+from typing import Tuple
 
 from pdf2markdown.domain.interfaces.language_detector import LanguageDetectorInterface
 from pdf2markdown.domain.models.document import CodeBlock
 from pdf2markdown.domain.models.document import CodeLanguage
 
 
-@dataclass
+@dataclass(frozen=True)
 class LanguagePattern:
-    """Pattern matching configuration for a programming language."""
-    keywords: Set[str] = field(default_factory=set)
-    syntax_patterns: List[str] = field(default_factory=list)  # Regex patterns
-    distinctive_chars: Set[str] = field(default_factory=set)
+    """Immutable pattern matching configuration for a programming language."""
+    keywords: FrozenSet[str] = frozenset()
+    syntax_patterns: Tuple[Pattern, ...] = ()  # Pre-compiled regex patterns
+    distinctive_chars: FrozenSet[str] = frozenset()
     weight: float = 1.0
+    # Word-boundary regex per keyword, derived from keywords
+    keyword_patterns: Tuple[Pattern, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Pre-compile keyword regexes once instead of on every detection call."""
+        object.__setattr__(self, "keyword_patterns", tuple(
+            re.compile(rf'\b{re.escape(keyword.lower())}\b') for keyword in self.keywords
+        ))
+
+
+def _compile_syntax_patterns(syntax_patterns: List[str]) -> Tuple[Pattern, ...]:
+    """Pre-compile syntax regex patterns, skipping invalid ones."""
+    compiled_patterns = []
+    for regex_pattern in syntax_patterns:
+        try:
+            compiled_patterns.append(re.compile(regex_pattern, re.IGNORECASE | re.MULTILINE))
+        except re.error:
+            # Skip invalid patterns
+            continue
+    return tuple(compiled_patterns)
+
+
+def _build_language_patterns() -> Dict[CodeLanguage, LanguagePattern]:
+    """Build the built-in language detection patterns."""
+    patterns = {}
+
+    # Python patterns
+    patterns[CodeLanguage.PYTHON] = LanguagePattern(
+        keywords=frozenset({
+            'def', 'class', 'import', 'from', 'if', 'elif', 'else',
+            'for', 'while', 'try', 'except', 'finally', 'with',
+            'lambda', 'yield', 'return', 'pass', 'break', 'continue',
+            'and', 'or', 'not', 'in', 'is', 'True', 'False', 'None',
+            '__init__', '__main__', 'self', 'print'
+        }),
+        syntax_patterns=_compile_syntax_patterns([
+            r'def\s+\w+\s*\(',  # Function definitions
+            r'class\s+\w+\s*[:\(]',  # Class definitions
+            r'import\s+\w+',  # Import statements
+            r'from\s+\w+\s+import',  # From imports
+            r'if\s+__name__\s*==\s*["\']__main__["\']',  # Main guard
+            r':\s*\n\s+',  # Indentation after colon
+        ]),
+        distinctive_chars=frozenset({':', '#'}),
+        weight=1.0
+    )
+
+    # JavaScript patterns
+    patterns[CodeLanguage.JAVASCRIPT] = LanguagePattern(
+        keywords=frozenset({
+            'function', 'var', 'let', 'const', 'if', 'else', 'for',
+            'while', 'do', 'switch', 'case', 'default', 'break',
+            'continue', 'return', 'try', 'catch', 'finally', 'throw',
+            'new', 'this', 'prototype', 'typeof', 'instanceof',
+            'console.log', 'document', 'window', 'null', 'undefined',
+            'true', 'false'
+        }),
+        syntax_patterns=_compile_syntax_patterns([
+            r'function\s+\w*\s*\(',  # Function declarations
+            r'\w+\s*=>\s*[\{\w]',  # Arrow functions
+            r'(var|let|const)\s+\w+',  # Variable declarations
+            r'console\.log\s*\(',  # Console logging
+            r'document\.\w+',  # DOM access
+            r'\{\s*[\w\s,:"\']+\s*\}',  # Object literals
+        ]),
+        distinctive_chars=frozenset({'{', '}', ';'}),
+        weight=1.0
+    )
+
+    # Java patterns
+    patterns[CodeLanguage.JAVA] = LanguagePattern(
+        keywords=frozenset({
+            'public', 'private', 'protected', 'static', 'final',
+            'class', 'interface', 'extends', 'implements', 'abstract',
+            'void', 'int', 'String', 'boolean', 'double', 'float',
+            'char', 'byte', 'short', 'long', 'if', 'else', 'for',
+            'while', 'do', 'switch', 'case', 'default', 'break',
+            'continue', 'return', 'try', 'catch', 'finally', 'throw',
+            'throws', 'new', 'this', 'super', 'null', 'true', 'false',
+            'System.out.println'
+        }),
+        syntax_patterns=_compile_syntax_patterns([
+            r'public\s+(static\s+)?void\s+main',  # Main method
+            r'public\s+class\s+\w+',  # Public class
+            r'System\.out\.print',  # System output
+            r'String\[\]\s+\w+',  # String array
+            r'@\w+',  # Annotations
+        ]),
+        distinctive_chars=frozenset({'{', '}', ';'}),
+        weight=1.0
+    )
+
+    # C++ patterns
+    patterns[CodeLanguage.CPP] = LanguagePattern(
+        keywords=frozenset({
+            'include', 'namespace', 'using', 'class', 'struct',
+            'public', 'private', 'protected', 'virtual', 'static',
+            'const', 'int', 'char', 'float', 'double', 'bool',
+            'void', 'auto', 'if', 'else', 'for', 'while',
+            'do', 'switch', 'case', 'default', 'break', 'continue',
+            'return', 'try', 'catch', 'throw', 'new', 'delete',
+            'this', 'nullptr', 'true', 'false', 'cout', 'cin',
+            'endl', 'std', 'vector', 'string', 'printf'
+        }),
+        syntax_patterns=_compile_syntax_patterns([
+            r'#include\s*<[\w\.]+>',  # Include statements
+            r'std::\w+',  # Standard library usage
+            r'\w+\s*\*+\s*\w+',  # Pointer declarations
+            r'cout\s*<<',  # Output stream
+            r'cin\s*>>',  # Input stream
+            r'::\w+',  # Scope resolution
+        ]),
+        distinctive_chars=frozenset({'*', '&', '<', '>', '#'}),
+        weight=1.0
+    )
+
+    # SQL patterns
+    patterns[CodeLanguage.SQL] = LanguagePattern(
+        keywords=frozenset({
+            'SELECT', 'FROM', 'WHERE', 'INSERT', 'UPDATE', 'DELETE',
+            'CREATE', 'DROP', 'ALTER', 'TABLE', 'INDEX', 'VIEW',
+            'JOIN', 'INNER', 'LEFT', 'RIGHT', 'OUTER', 'ON',
+            'GROUP', 'BY', 'ORDER', 'HAVING', 'UNION', 'ALL',
+            'DISTINCT', 'COUNT', 'SUM', 'AVG', 'MIN', 'MAX',
+            'AND', 'OR', 'NOT', 'NULL', 'IS', 'IN', 'LIKE',
+            'BETWEEN', 'EXISTS', 'CASE', 'WHEN', 'THEN', 'ELSE', 'END'
+        }),
+        syntax_patterns=_compile_syntax_patterns([
+            r'SELECT\s+[\w\s,\*]+\s+FROM',  # SELECT queries
+            r'INSERT\s+INTO\s+\w+',  # INSERT statements
+            r'UPDATE\s+\w+\s+SET',  # UPDATE statements
+            r'DELETE\s+FROM\s+\w+',  # DELETE statements
+            r'CREATE\s+TABLE\s+\w+',  # CREATE TABLE
+            r'\w+\s*=\s*[\'"][^\'"]*[\'"]',  # String comparisons
+        ]),
+        distinctive_chars=frozenset({';'}),
+        weight=1.0
+    )
+
+    # HTML patterns
+    patterns[CodeLanguage.HTML] = LanguagePattern(
+        keywords=frozenset({
+            'html', 'head', 'body', 'title', 'meta', 'link',
+            'script', 'style', 'div', 'span', 'p', 'h1', 'h2',
+            'h3', 'h4', 'h5', 'h6', 'a', 'img', 'ul', 'ol',
+            'li', 'table', 'tr', 'td', 'th', 'form', 'input',
+            'button', 'select', 'option', 'textarea', 'DOCTYPE'
+        }),
+        syntax_patterns=_compile_syntax_patterns([
+            r'<\s*\w+[^>]*>',  # Opening tags
+            r'<\s*/\s*\w+\s*>',  # Closing tags
+            r'<!DOCTYPE\s+html>',  # DOCTYPE declaration
+            r'\w+\s*=\s*["\'][^"\']*["\']',  # Attributes
+            r'<!--.*?-->',  # Comments
+        ]),
+        distinctive_chars=frozenset({'<', '>', '/', '=', '"', "'"}),
+        weight=1.0
+    )
+
+    # JSON patterns
+    patterns[CodeLanguage.JSON] = LanguagePattern(
+        keywords=frozenset({
+            'true', 'false', 'null'
+        }),
+        syntax_patterns=_compile_syntax_patterns([
+            r'\{\s*"[\w\s]+"\s*:\s*["\w\[\{]',  # Object with string keys
+            r'"\w+"\s*:\s*\{',  # Nested objects
+            r'"\w+"\s*:\s*\[',  # Arrays
+            r'"\w+"\s*:\s*(true|false|null|\d+)',  # Primitive values
+            r'\[\s*\{',  # Array of objects
+        ]),
+        distinctive_chars=frozenset({'{', '}', '[', ']', ':', ',', '"'}),
+        weight=1.0
+    )
+
+    return patterns
+
+
+# Built-in tables are frozen at import; detectors only derive new mappings from them
+_LANGUAGE_PATTERNS: Mapping[CodeLanguage, LanguagePattern] = MappingProxyType(_build_language_patterns())
 
 
 class LanguageDetector(LanguageDetectorInterface):
@@ -41,14 +226,11 @@ class LanguageDetector(LanguageDetectorInterface):
         Args:
             custom_patterns: Optional custom patterns for specific languages
         """
-        self.patterns = self._initialize_language_patterns()
+        self.patterns: Mapping[CodeLanguage, LanguagePattern] = _LANGUAGE_PATTERNS
 
         # Add custom patterns if provided
         if custom_patterns:
-            self._add_custom_patterns(custom_patterns)
-
-        # Pre-compile regex patterns for performance
-        self._compile_patterns()
+            self.patterns = self._merge_custom_patterns(custom_patterns)
 
     def detect_language(self, code_content: str) -> CodeLanguage:
         """
@@ -65,16 +247,16 @@ class LanguageDetector(LanguageDetectorInterface):
 
         scores = {}
 
-        # Combine keyword and syntax detection
-        keyword_result = self.detect_language_from_keywords(code_content)
-        syntax_result = self.detect_language_from_syntax(code_content)
+        # Confidence scores already combine keyword, syntax and character evidence,
+        # so the content is only scanned once per language and lowercased once
+        content_lower = code_content.lower()
 
         # Calculate confidence scores for all languages
         for language in CodeLanguage:
-            if language == CodeLanguage.UNKNOWN:
+            if language == CodeLanguage.UNKNOWN or language not in self.patterns:
                 continue
 
-            confidence = self.get_confidence_score(code_content, language)
+            confidence = self._calculate_confidence(code_content, content_lower, self.patterns[language])
             scores[language] = confidence
 
         # Return the language with highest confidence
@@ -104,9 +286,9 @@ class LanguageDetector(LanguageDetectorInterface):
                 continue
 
             count = 0
-            for keyword in pattern.keywords:
-                # Use word boundaries to avoid partial matches
-                if re.search(rf'\b{re.escape(keyword.lower())}\b', content_lower):
+            for keyword_pattern in pattern.keyword_patterns:
+                # Patterns use word boundaries to avoid partial matches
+                if keyword_pattern.search(content_lower):
                     count += 1
 
             word_counts[language] = count * pattern.weight
@@ -187,16 +369,17 @@ class LanguageDetector(LanguageDetectorInterface):
         if language not in self.patterns:
             return 0.0
 
-        pattern = self.patterns[language]
-        content_lower = code_content.lower()
+        return self._calculate_confidence(code_content, code_content.lower(), self.patterns[language])
 
+    def _calculate_confidence(self, code_content: str, content_lower: str, pattern: LanguagePattern) -> float:
+        """Score content against one language pattern, reusing the lowercased content."""
         # Calculate keyword confidence
         keyword_matches = 0
         total_keywords = len(pattern.keywords)
 
         if total_keywords > 0:
-            for keyword in pattern.keywords:
-                if re.search(rf'\b{re.escape(keyword.lower())}\b', content_lower):
+            for keyword_pattern in pattern.keyword_patterns:
+                if keyword_pattern.search(content_lower):
                     keyword_matches += 1
 
             keyword_confidence = keyword_matches / total_keywords
@@ -244,180 +427,16 @@ class LanguageDetector(LanguageDetectorInterface):
 
         return min(overall_confidence, 1.0)
 
-    def _initialize_language_patterns(self) -> Dict[CodeLanguage, LanguagePattern]:
-        """Initialize built-in language detection patterns."""
-        patterns = {}
-
-        # Python patterns
-        patterns[CodeLanguage.PYTHON] = LanguagePattern(
-            keywords={
-                'def', 'class', 'import', 'from', 'if', 'elif', 'else',
-                'for', 'while', 'try', 'except', 'finally', 'with',
-                'lambda', 'yield', 'return', 'pass', 'break', 'continue',
-                'and', 'or', 'not', 'in', 'is', 'True', 'False', 'None',
-                '__init__', '__main__', 'self', 'print'
-            },
-            syntax_patterns=[
-                r'def\s+\w+\s*\(',  # Function definitions
-                r'class\s+\w+\s*[:\(]',  # Class definitions
-                r'import\s+\w+',  # Import statements
-                r'from\s+\w+\s+import',  # From imports
-                r'if\s+__name__\s*==\s*["\']__main__["\']',  # Main guard
-                r':\s*\n\s+',  # Indentation after colon
-            ],
-            distinctive_chars={':', '#'},
-            weight=1.0
-        )
-
-        # JavaScript patterns
-        patterns[CodeLanguage.JAVASCRIPT] = LanguagePattern(
-            keywords={
-                'function', 'var', 'let', 'const', 'if', 'else', 'for',
-                'while', 'do', 'switch', 'case', 'default', 'break',
-                'continue', 'return', 'try', 'catch', 'finally', 'throw',
-                'new', 'this', 'prototype', 'typeof', 'instanceof',
-                'console.log', 'document', 'window', 'null', 'undefined',
-                'true', 'false'
-            },
-            syntax_patterns=[
-                r'function\s+\w*\s*\(',  # Function declarations
-                r'\w+\s*=>\s*[\{\w]',  # Arrow functions
-                r'(var|let|const)\s+\w+',  # Variable declarations
-                r'console\.log\s*\(',  # Console logging
-                r'document\.\w+',  # DOM access
-                r'\{\s*[\w\s,:"\']+\s*\}',  # Object literals
-            ],
-            distinctive_chars={'{', '}', ';'},
-            weight=1.0
-        )
-
-        # Java patterns
-        patterns[CodeLanguage.JAVA] = LanguagePattern(
-            keywords={
-                'public', 'private', 'protected', 'static', 'final',
-                'class', 'interface', 'extends', 'implements', 'abstract',
-                'void', 'int', 'String', 'boolean', 'double', 'float',
-                'char', 'byte', 'short', 'long', 'if', 'else', 'for',
-                'while', 'do', 'switch', 'case', 'default', 'break',
-                'continue', 'return', 'try', 'catch', 'finally', 'throw',
-                'throws', 'new', 'this', 'super', 'null', 'true', 'false',
-                'System.out.println'
-            },
-            syntax_patterns=[
-                r'public\s+(static\s+)?void\s+main',  # Main method
-                r'public\s+class\s+\w+',  # Public class
-                r'System\.out\.print',  # System output
-                r'String\[\]\s+\w+',  # String array
-                r'@\w+',  # Annotations
-            ],
-            distinctive_chars={'{', '}', ';'},
-            weight=1.0
-        )
-
-        # C++ patterns
-        patterns[CodeLanguage.CPP] = LanguagePattern(
-            keywords={
-                'include', 'namespace', 'using', 'class', 'struct',
-                'public', 'private', 'protected', 'virtual', 'static',
-                'const', 'int', 'char', 'float', 'double', 'bool',
-                'void', 'auto', 'if', 'else', 'for', 'while',
-                'do', 'switch', 'case', 'default', 'break', 'continue',
-                'return', 'try', 'catch', 'throw', 'new', 'delete',
-                'this', 'nullptr', 'true', 'false', 'cout', 'cin',
-                'endl', 'std', 'vector', 'string', 'printf'
-            },
-            syntax_patterns=[
-                r'#include\s*<[\w\.]+>',  # Include statements
-                r'std::\w+',  # Standard library usage
-                r'\w+\s*\*+\s*\w+',  # Pointer declarations
-                r'cout\s*<<',  # Output stream
-                r'cin\s*>>',  # Input stream
-                r'::\w+',  # Scope resolution
-            ],
-            distinctive_chars={'*', '&', '<', '>', '#'},
-            weight=1.0
-        )
-
-        # SQL patterns
-        patterns[CodeLanguage.SQL] = LanguagePattern(
-            keywords={
-                'SELECT', 'FROM', 'WHERE', 'INSERT', 'UPDATE', 'DELETE',
-                'CREATE', 'DROP', 'ALTER', 'TABLE', 'INDEX', 'VIEW',
-                'JOIN', 'INNER', 'LEFT', 'RIGHT', 'OUTER', 'ON',
-                'GROUP', 'BY', 'ORDER', 'HAVING', 'UNION', 'ALL',
-                'DISTINCT', 'COUNT', 'SUM', 'AVG', 'MIN', 'MAX',
-                'AND', 'OR', 'NOT', 'NULL', 'IS', 'IN', 'LIKE',
-                'BETWEEN', 'EXISTS', 'CASE', 'WHEN', 'THEN', 'ELSE', 'END'
-            },
-            syntax_patterns=[
-                r'SELECT\s+[\w\s,\*]+\s+FROM',  # SELECT queries
-                r'INSERT\s+INTO\s+\w+',  # INSERT statements
-                r'UPDATE\s+\w+\s+SET',  # UPDATE statements
-                r'DELETE\s+FROM\s+\w+',  # DELETE statements
-                r'CREATE\s+TABLE\s+\w+',  # CREATE TABLE
-                r'\w+\s*=\s*[\'"][^\'"]*[\'"]',  # String comparisons
-            ],
-            distinctive_chars={';'},
-            weight=1.0
-        )
-
-        # HTML patterns
-        patterns[CodeLanguage.HTML] = LanguagePattern(
-            keywords={
-                'html', 'head', 'body', 'title', 'meta', 'link',
-                'script', 'style', 'div', 'span', 'p', 'h1', 'h2',
-                'h3', 'h4', 'h5', 'h6', 'a', 'img', 'ul', 'ol',
-                'li', 'table', 'tr', 'td', 'th', 'form', 'input',
-                'button', 'select', 'option', 'textarea', 'DOCTYPE'
-            },
-            syntax_patterns=[
-                r'<\s*\w+[^>]*>',  # Opening tags
-                r'<\s*/\s*\w+\s*>',  # Closing tags
-                r'<!DOCTYPE\s+html>',  # DOCTYPE declaration
-                r'\w+\s*=\s*["\'][^"\']*["\']',  # Attributes
-                r'<!--.*?-->',  # Comments
-            ],
-            distinctive_chars={'<', '>', '/', '=', '"', "'"},
-            weight=1.0
-        )
-
-        # JSON patterns
-        patterns[CodeLanguage.JSON] = LanguagePattern(
-            keywords={
-                'true', 'false', 'null'
-            },
-            syntax_patterns=[
-                r'\{\s*"[\w\s]+"\s*:\s*["\w\[\{]',  # Object with string keys
-                r'"\w+"\s*:\s*\{',  # Nested objects
-                r'"\w+"\s*:\s*\[',  # Arrays
-                r'"\w+"\s*:\s*(true|false|null|\d+)',  # Primitive values
-                r'\[\s*\{',  # Array of objects
-            ],
-            distinctive_chars={'{', '}', '[', ']', ':', ',', '"'},
-            weight=1.0
-        )
-
-        return patterns
-
-    def _add_custom_patterns(self, custom_patterns: Dict[str, List[str]]) -> None:
-        """Add custom patterns to existing language patterns."""
+    def _merge_custom_patterns(self, custom_patterns: Dict[str, List[str]]) -> Mapping[CodeLanguage, LanguagePattern]:
+        """Build an immutable pattern mapping with custom keywords merged into the built-ins."""
+        patterns = dict(self.patterns)
         for lang_name, keywords in custom_patterns.items():
             try:
                 language = CodeLanguage(lang_name.lower())
-                if language in self.patterns:
-                    self.patterns[language].keywords.update(keywords)
             except ValueError:
                 # Ignore unknown languages
                 continue
-
-    def _compile_patterns(self) -> None:
-        """Pre-compile regex patterns for performance."""
-        for language, pattern in self.patterns.items():
-            compiled_patterns = []
-            for regex_pattern in pattern.syntax_patterns:
-                try:
-                    compiled_patterns.append(re.compile(regex_pattern, re.IGNORECASE | re.MULTILINE))
-                except re.error:
-                    # Skip invalid patterns
-                    continue
-            pattern.syntax_patterns = compiled_patterns
+            if language in patterns:
+                pattern = patterns[language]
+                patterns[language] = replace(pattern, keywords=pattern.keywords | frozenset(keywords))
+        return MappingProxyType(patterns)
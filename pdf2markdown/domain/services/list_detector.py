@@ -1,9 +1,14 @@
 """List detection service implementing pattern recognition and hierarchy analysis."""
 
 import re
+from collections import OrderedDict
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Pattern
+from typing import Tuple
 
 from pdf2markdown.domain.interfaces.list_detector import ListDetectorInterface
 from pdf2markdown.domain.models.document import Line
@@ -12,6 +17,38 @@ from pdf2markdown.domain.models.document import ListItem
 from pdf2markdown.domain.models.document import ListMarker
 from pdf2markdown.domain.models.document import ListType
 
+# Upper bound on memoized marker lookups kept per detector instance
+_MARKER_CACHE_SIZE = 1024
+
+# Characters a list marker can start with once leading whitespace is removed:
+# bullet symbols, the "(" of parenthetical markers and ASCII letters for
+# alphabetic/roman markers. Digits are checked with str.isdecimal() to match
+# the Unicode-aware \d used by the ordered patterns.
+_MARKER_FIRST_CHARS = frozenset(
+    '•◦▪▫■□○●-*+('
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+)
+
+# Key for grouping consecutive list items into runs of the same list type
+_item_list_type = attrgetter("marker.marker_type")
+
+# Shared pool of immutable bullet, letter and roman markers. The patterns admit
+# only a finite set of those, so the pool stays bounded; numeric markers (\d+)
+# are unbounded and are never pooled.
+_MARKER_POOL: Dict[Tuple[ListType, str, str, str], ListMarker] = {}
+
+
+def _get_marker(marker_type: ListType, symbol: str, prefix: str, suffix: str) -> ListMarker:
+    """Return the pooled ListMarker for the given parts, creating it on first use."""
+    if symbol.isdecimal():
+        return ListMarker(marker_type, symbol, prefix, suffix)
+
+    key = (marker_type, symbol, prefix, suffix)
+    marker = _MARKER_POOL.get(key)
+    if marker is None:
+        marker = _MARKER_POOL.setdefault(key, ListMarker(marker_type, symbol, prefix, suffix))
+    return marker
+
 
 class ListDetector(ListDetectorInterface):
     """
@@ -45,6 +82,10 @@ class ListDetector(ListDetectorInterface):
         self._bullet_patterns = self._compile_bullet_patterns()
         self._ordered_patterns = self._compile_ordered_patterns()
 
+        # Marker detection depends only on the line text, so results are memoized
+        # by text to avoid re-running the pattern loop for repeated lookups
+        self._marker_cache: OrderedDict[str, Optional[ListMarker]] = OrderedDict()
+
     def _compile_bullet_patterns(self) -> List[Pattern]:
         """Compile regex patterns for bullet point detection."""
         bullet_markers = [
@@ -52,14 +93,11 @@ class ListDetector(ListDetectorInterface):
             r'-', r'\*', r'\+'  # ASCII bullets (escaped for regex)
         ]
 
-        patterns = []
-        for marker in bullet_markers:
-            # Pattern: optional whitespace + marker + required space + optional content
-            # This allows for empty content after marker (like "• ")
-            pattern = rf'^(\s*)({marker})\s+(.*)$'
-            patterns.append(re.compile(pattern))
-
-        return patterns
+        # Single pattern over all markers so each line's text is scanned once
+        # Pattern: optional whitespace + marker + required space + optional content
+        # This allows for empty content after marker (like "• ")
+        marker_alternation = '|'.join(bullet_markers)
+        return [re.compile(rf'^(\s*)({marker_alternation})\s+(.*)$')]
 
     def _compile_ordered_patterns(self) -> List[Pattern]:
         """Compile regex patterns for ordered list detection."""
@@ -93,7 +131,27 @@ class ListDetector(ListDetectorInterface):
         """
         text = line.text  # Keep original text with trailing spaces for pattern matching
 
-        if not text.strip():
+        if text in self._marker_cache:
+            self._marker_cache.move_to_end(text)
+            return self._marker_cache[text]
+
+        marker = self._match_list_marker(text)
+
+        self._marker_cache[text] = marker
+        if len(self._marker_cache) > _MARKER_CACHE_SIZE:
+            self._marker_cache.popitem(last=False)
+
+        return marker
+
+    def _match_list_marker(self, text: str) -> Optional[ListMarker]:
+        """Run the bullet and ordered patterns against raw line text."""
+        stripped = text.lstrip()
+        if not stripped:
+            return None
+
+        # Cheap prefilter so plain prose lines skip the regex patterns entirely
+        first_char = stripped[0]
+        if first_char not in _MARKER_FIRST_CHARS and not first_char.isdecimal():
             return None
 
         # Try bullet patterns first
@@ -101,12 +159,7 @@ class ListDetector(ListDetectorInterface):
             match = pattern.match(text)
             if match:
                 indent_str, marker_symbol, content = match.groups()
-                return ListMarker(
-                    marker_type=ListType.UNORDERED,
-                    symbol=marker_symbol,
-                    prefix="",
-                    suffix=" "
-                )
+                return _get_marker(ListType.UNORDERED, marker_symbol, "", " ")
 
         # Try ordered patterns
         for pattern in self._ordered_patterns:
@@ -124,12 +177,7 @@ class ListDetector(ListDetectorInterface):
                 else:
                     continue
 
-                return ListMarker(
-                    marker_type=ListType.ORDERED,
-                    symbol=marker_symbol,
-                    prefix=prefix,
-                    suffix=suffix
-                )
+                return _get_marker(ListType.ORDERED, marker_symbol, prefix, suffix)
 
         return None
 
@@ -146,17 +194,23 @@ class ListDetector(ListDetectorInterface):
         if not lines:
             return []
 
+        # Detect every marker up front so the scan below only branches on results
+        markers = [self.detect_list_marker(line) for line in lines]
+
         list_items = []
-        current_item = None
         base_x_position = None  # Track base indentation level
 
-        for line in lines:
-            marker = self.detect_list_marker(line)
+        # State of the item being accumulated; its ListItem is built once on close
+        item_marker: Optional[ListMarker] = None
+        item_level = 0
+        item_lines: List[Line] = []
+        item_content: List[str] = []
 
+        for line, marker in zip(lines, markers):
             if marker:
                 # Save any current item before starting new one
-                if current_item:
-                    list_items.append(current_item)
+                if item_marker:
+                    list_items.append(self._build_list_item(item_marker, item_level, item_lines, item_content))
 
                 # Determine nesting level based on x-position
                 level = self._calculate_nesting_level(line, base_x_position)
@@ -170,35 +224,43 @@ class ListDetector(ListDetectorInterface):
                 if not content.strip():
                     content = "[empty]"  # Placeholder for empty list items
 
-                # Create list item
-                current_item = ListItem(
-                    content=content,
-                    level=min(level, self.max_nesting_level),
-                    marker=marker,
-                    lines=[line]
-                )
+                item_marker = marker
+                item_level = min(level, self.max_nesting_level)
+                item_lines = [line]
+                item_content = [content]
             # Check if this is a continuation line
-            elif current_item and self._is_continuation_line(line, current_item):
+            elif item_marker and self._is_continuation_line(line, item_lines[0], item_marker):
                 # Append to current item's content
                 continuation_content = line.text.strip()
                 if continuation_content:
-                    current_item = ListItem(
-                        content=f"{current_item.content} {continuation_content}",
-                        level=current_item.level,
-                        marker=current_item.marker,
-                        lines=current_item.lines + [line]
-                    )
+                    item_content.append(continuation_content)
+                    item_lines.append(line)
             # Non-continuation line - save current item if exists
-            elif current_item:
-                list_items.append(current_item)
-                current_item = None
+            elif item_marker:
+                list_items.append(self._build_list_item(item_marker, item_level, item_lines, item_content))
+                item_marker = None
 
         # Don't forget the last item
-        if current_item:
-            list_items.append(current_item)
+        if item_marker:
+            list_items.append(self._build_list_item(item_marker, item_level, item_lines, item_content))
 
         return list_items
 
+    def _build_list_item(
+        self,
+        marker: ListMarker,
+        level: int,
+        lines: List[Line],
+        content_parts: List[str]
+    ) -> ListItem:
+        """Create the immutable ListItem once all of its lines have been collected."""
+        return ListItem(
+            content=" ".join(content_parts),
+            level=level,
+            marker=marker,
+            lines=lines
+        )
+
     def group_list_items_into_blocks(self, list_items: List[ListItem]) -> List[ListBlock]:
         """
         Group list items into cohesive list blocks.
@@ -213,26 +275,19 @@ class ListDetector(ListDetectorInterface):
             return []
 
         blocks = []
-        current_block = None
 
-        for item in list_items:
-            # Check if we need to start a new block
-            if (current_block is None or
-                current_block.list_type != item.marker.marker_type or
-                self._should_start_new_block(current_block, item)):
+        # Consecutive items of the same list type form a run; a run is only split
+        # further when the nesting level jumps too far between neighbouring items
+        for list_type, run in groupby(list_items, key=_item_list_type):
+            current_block = ListBlock(list_type=list_type)
 
-                # Save current block if exists
-                if current_block and not current_block.is_empty():
+            for item in run:
+                if not current_block.is_empty() and self._should_start_new_block(current_block, item):
                     blocks.append(current_block)
+                    current_block = ListBlock(list_type=list_type)
 
-                # Start new block
-                current_block = ListBlock(list_type=item.marker.marker_type)
-
-            # Add item to current block
-            current_block.add_item(item)
+                current_block.add_item(item)
 
-        # Don't forget the last block
-        if current_block and not current_block.is_empty():
             blocks.append(current_block)
 
         return blocks
@@ -292,18 +347,8 @@ class ListDetector(ListDetectorInterface):
                     return " ".join(words[1:])
                 return text.strip()
 
-    def _is_continuation_line(self, line: Line, current_item: ListItem) -> bool:
-        """Check if a line is a continuation of the current list item."""
-        if not current_item or not current_item.lines:
-            return False
-
-        # Get the x-position of the current item's first line
-        first_line = current_item.lines[0]
-        marker = self.detect_list_marker(first_line)
-
-        if not marker:
-            return False
-
+    def _is_continuation_line(self, line: Line, first_line: Line, marker: ListMarker) -> bool:
+        """Check if a line continues the item that starts at first_line with marker."""
         # Calculate expected indentation for continuation
         marker_length = len(marker.as_string())
         expected_x_position = first_line.x_position + (marker_length * 2)  # Approximate character width
@@ -1,9 +1,10 @@
 """Paragraph detection service implementing text flow analysis."""
 
-from statistics import mean
-from statistics import stdev
+from math import fsum
+from math import sqrt
 from typing import Dict
 from typing import List
+from typing import Sequence
 
 from pdf2markdown.domain.interfaces.paragraph_detector import ParagraphDetectorInterface
 from pdf2markdown.domain.models.document import Block
@@ -15,6 +16,20 @@ from pdf2markdown.domain.models.document import TextBlock
 from pdf2markdown.domain.models.document import TextFlow
 
 
+def _mean(values: Sequence[float]) -> float:
+    """Arithmetic mean of a non-empty sequence of floats.
+
+    statistics.mean works in exact fractions and is far slower on long
+    documents, so this sums the plain floats with fsum instead.
+    """
+    return fsum(values) / len(values)
+
+
+def _line_gaps(lines: List[Line]) -> List[float]:
+    """Vertical gaps between each line and the next, in a single pass."""
+    return [upper.vertical_spacing_to(lower) for upper, lower in zip(lines, lines[1:])]
+
+
 class ParagraphDetector(ParagraphDetectorInterface):
     """
     Service for detecting paragraphs and analyzing text flow.
@@ -156,22 +171,24 @@ class ParagraphDetector(ParagraphDetectorInterface):
                 "paragraph_breaks": []
             }
 
-        spacings = []
-        for i in range(len(lines) - 1):
-            spacing = lines[i].vertical_spacing_to(lines[i + 1])
-            spacings.append(spacing)
+        spacings = _line_gaps(lines)
+        spacing_count = len(spacings)
 
-        average_spacing = mean(spacings)
-        spacing_std = stdev(spacings) if len(spacings) > 1 else 0.0
+        average_spacing = _mean(spacings)
+        if spacing_count > 1:
+            squared_deviation = fsum((spacing - average_spacing) ** 2 for spacing in spacings)
+            spacing_std = sqrt(squared_deviation / (spacing_count - 1))
+        else:
+            spacing_std = 0.0
         consistency = 1.0 - (spacing_std / (average_spacing + 1.0))  # Avoid division by zero
 
         # Detect paragraph breaks (spacing significantly larger than average)
-        paragraph_breaks = []
         threshold = average_spacing * self.line_spacing_threshold
-
-        for i, spacing in enumerate(spacings):
-            if spacing > threshold:
-                paragraph_breaks.append(i + 1)  # Index of line starting new paragraph
+        paragraph_breaks = [
+            i + 1  # Index of line starting new paragraph
+            for i, spacing in enumerate(spacings)
+            if spacing > threshold
+        ]
 
         return {
             "average_spacing": average_spacing,
@@ -196,7 +213,7 @@ class ParagraphDetector(ParagraphDetectorInterface):
             return TextAlignment.LEFT
 
         # Check for center alignment (positions vary around a center point)
-        x_mean = mean(x_positions)
+        x_mean = _mean(x_positions)
         center_variance = sum(abs(pos - x_mean) for pos in x_positions) / len(x_positions)
 
         if center_variance <= self.alignment_tolerance * 2:
@@ -223,15 +240,12 @@ class ParagraphDetector(ParagraphDetectorInterface):
 
         alignment = self._detect_text_alignment(lines)
         indentation = self._detect_indentation(lines)
-        average_height = mean(line.height for line in lines)
+        average_height = _mean([line.height for line in lines])
 
         # Calculate line spacing (simplified)
         if len(lines) > 1:
-            spacings = []
-            for i in range(len(lines) - 1):
-                spacing = lines[i].vertical_spacing_to(lines[i + 1])
-                spacings.append(spacing / average_height)  # Normalize by line height
-            line_spacing = mean(spacings) if spacings else 1.0
+            # Normalize by line height
+            line_spacing = _mean(_line_gaps(lines)) / average_height
         else:
             line_spacing = 1.0
 
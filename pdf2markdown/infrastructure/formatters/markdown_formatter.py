@@ -1,6 +1,8 @@
 """Markdown formatter for converting documents to markdown format."""
 
+import io
 import logging
+from typing import TextIO
 
 from pdf2markdown.domain.interfaces import FormatterInterface
 from pdf2markdown.domain.models import Document
@@ -41,6 +43,16 @@ class MarkdownFormatter(FormatterInterface):
         self.logger.info(f"Formatted document with {len(document.blocks)} blocks to markdown")
         return markdown_content
 
+    def format_to_stream(self, document: Document, stream: TextIO) -> None:
+        """
+        Convert document to markdown and write it to an open text stream.
+
+        Args:
+            document: Document to convert
+            stream: Writable text stream, such as an open file or io.StringIO
+        """
+        stream.write(self.format_document(document))
+
     def format_to_file(self, document: Document, output_path: str) -> None:
         """
         Convert document to markdown and write to file.
@@ -53,10 +65,11 @@ class MarkdownFormatter(FormatterInterface):
             IOError: If file cannot be written
         """
         try:
-            markdown_content = self.format_document(document)
-
+            # Format into memory before opening so a failure cannot truncate an existing file
+            buffer = io.StringIO()
+            self.format_to_stream(document, buffer)
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                f.write(buffer.getvalue())
 
             self.logger.info(f"Written markdown to {output_path}")
 
@@ -0,0 +1,14 @@
+"""Shared pytest configuration for the whole test suite."""
+
+import os
+import tempfile
+from pathlib import Path
+
+# Opt-in for local runs: PYTEST_RAMDISK=<dir> pytest places tmp_path and
+# tmp_path_factory directories under <dir>, e.g. a mounted tmpfs. /dev/shm does
+# not work here because FileValidator rejects every path under /dev.
+_RAMDISK = os.environ.get("PYTEST_RAMDISK")
+
+if _RAMDISK and Path(_RAMDISK).is_dir():
+    os.environ["TMPDIR"] = _RAMDISK
+    tempfile.tempdir = None  # Drop any cached value so gettempdir() rereads TMPDIR
@@ -6,10 +6,11 @@ file validation, and output generation following the test pyramid
 (20% integration tests).
 """
 
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from pdf2markdown.cli.main import PdfToMarkdownCli
 from pdf2markdown.core.config import ApplicationConfig
 
@@ -17,9 +18,10 @@ from pdf2markdown.core.config import ApplicationConfig
 class TestCliIntegration:
     """Integration test suite for CLI application."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path: Path) -> None:
+        """Set up test fixtures in pytest's per-test temporary directory."""
+        self.temp_dir = tmp_path
 
         # Create proper test PDF file with valid structure
         self.test_pdf = self.temp_dir / "test_document.pdf"
@@ -101,11 +103,6 @@ startxref
 %%EOF"""
         self.test_pdf.write_bytes(pdf_content)
 
-    def teardown_method(self) -> None:
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_successful_pdf_conversion_minimal_args(self) -> None:
         """Test successful PDF conversion with minimal arguments."""
         # Arrange
@@ -0,0 +1,26 @@
+"""Shared fixtures for top-level unit tests."""
+
+from contextlib import contextmanager
+
+import pytest
+
+from pdf2markdown.core.config import ApplicationConfig
+from pdf2markdown.core.exceptions import ValidationError
+
+
+@pytest.fixture(scope="session")
+def default_app_config() -> ApplicationConfig:
+    """Provide one default ApplicationConfig for the session; it is frozen."""
+    return ApplicationConfig()
+
+
+@pytest.fixture(scope="session")
+def assert_raises_field():
+    """Provide a context manager asserting a ValidationError's code and failing field."""
+    @contextmanager
+    def _assert_raises_field(code, field):
+        with pytest.raises(ValidationError) as exc_info:
+            yield exc_info
+        assert exc_info.value.code is code
+        assert exc_info.value.details["field"] == field
+    return _assert_raises_field
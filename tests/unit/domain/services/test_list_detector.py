@@ -3,6 +3,7 @@
 import pytest
 
 from pdf2markdown.domain.models.document import Line, ListType, ListMarker, ListItem
+from pdf2markdown.domain.services.list_detector import _MARKER_POOL
 from pdf2markdown.domain.services.list_detector import ListDetector
 
 
@@ -39,93 +40,50 @@ class TestListDetector:
             assert marker.prefix == ""
             assert marker.suffix == " "
 
-    def test_detect_numbered_markers(self, detector):
-        """Test detection of numbered list markers."""
-        numbered_tests = [
-            ("1. First item", "1", "", ". "),
-            ("2. Second item", "2", "", ". "),
-            ("10. Tenth item", "10", "", ". "),
-            ("1) First item", "1", "", ") "),
-            ("2) Second item", "2", "", ") "),
-            ("10) Tenth item", "10", "", ") "),
-        ]
-        
-        for text, expected_symbol, expected_prefix, expected_suffix in numbered_tests:
-            line = Line(text, 100.0, 50.0, 12.0)
-            marker = detector.detect_list_marker(line)
-            
-            assert marker is not None, f"Failed to detect marker in '{text}'"
-            assert marker.marker_type == ListType.ORDERED
-            assert marker.symbol == expected_symbol
-            assert marker.prefix == expected_prefix
-            assert marker.suffix == expected_suffix
-
-    def test_detect_alphabetic_markers(self, detector):
-        """Test detection of alphabetic list markers."""
-        alpha_tests = [
-            ("a. First item", "a", "", ". "),
-            ("b. Second item", "b", "", ". "),
-            ("z. Last item", "z", "", ". "),
-            ("A. First item", "A", "", ". "),
-            ("B. Second item", "B", "", ". "),
-            ("Z. Last item", "Z", "", ". "),
-        ]
-        
-        for text, expected_symbol, expected_prefix, expected_suffix in alpha_tests:
-            line = Line(text, 100.0, 50.0, 12.0)
-            marker = detector.detect_list_marker(line)
-            
-            assert marker is not None, f"Failed to detect marker in '{text}'"
-            assert marker.marker_type == ListType.ORDERED
-            assert marker.symbol == expected_symbol
-            assert marker.prefix == expected_prefix
-            assert marker.suffix == expected_suffix
-
-    def test_detect_roman_numeral_markers(self, detector):
-        """Test detection of roman numeral markers."""
-        roman_tests = [
-            ("i. First item", "i", "", ". "),
-            ("ii. Second item", "ii", "", ". "),
-            ("iii. Third item", "iii", "", ". "),
-            ("iv. Fourth item", "iv", "", ". "),
-            ("v. Fifth item", "v", "", ". "),
-            ("I. First item", "I", "", ". "),
-            ("II. Second item", "II", "", ". "),
-            ("III. Third item", "III", "", ". "),
-            ("IV. Fourth item", "IV", "", ". "),
-            ("V. Fifth item", "V", "", ". "),
-        ]
-        
-        for text, expected_symbol, expected_prefix, expected_suffix in roman_tests:
-            line = Line(text, 100.0, 50.0, 12.0)
-            marker = detector.detect_list_marker(line)
-            
-            assert marker is not None, f"Failed to detect marker in '{text}'"
-            assert marker.marker_type == ListType.ORDERED
-            assert marker.symbol == expected_symbol
-            assert marker.prefix == expected_prefix
-            assert marker.suffix == expected_suffix
+    @pytest.mark.parametrize("text,expected_symbol,expected_prefix,expected_suffix", [
+        # Numbered markers
+        ("1. First item", "1", "", ". "),
+        ("2. Second item", "2", "", ". "),
+        ("10. Tenth item", "10", "", ". "),
+        ("1) First item", "1", "", ") "),
+        ("2) Second item", "2", "", ") "),
+        ("10) Tenth item", "10", "", ") "),
+        # Alphabetic markers
+        ("a. First item", "a", "", ". "),
+        ("b. Second item", "b", "", ". "),
+        ("z. Last item", "z", "", ". "),
+        ("A. First item", "A", "", ". "),
+        ("B. Second item", "B", "", ". "),
+        ("Z. Last item", "Z", "", ". "),
+        # Roman numeral markers
+        ("i. First item", "i", "", ". "),
+        ("ii. Second item", "ii", "", ". "),
+        ("iii. Third item", "iii", "", ". "),
+        ("iv. Fourth item", "iv", "", ". "),
+        ("v. Fifth item", "v", "", ". "),
+        ("I. First item", "I", "", ". "),
+        ("II. Second item", "II", "", ". "),
+        ("III. Third item", "III", "", ". "),
+        ("IV. Fourth item", "IV", "", ". "),
+        ("V. Fifth item", "V", "", ". "),
+        # Parenthetical markers
+        ("(1) First item", "1", "(", ") "),
+        ("(2) Second item", "2", "(", ") "),
+        ("(a) First item", "a", "(", ") "),
+        ("(b) Second item", "b", "(", ") "),
+        ("(i) First item", "i", "(", ") "),
+        ("(ii) Second item", "ii", "(", ") "),
+    ])
+    def test_detect_ordered_markers(self, detector, text, expected_symbol, expected_prefix, expected_suffix):
+        """Test detection of numbered, alphabetic, roman numeral and parenthetical markers."""
+        line = Line(text, 100.0, 50.0, 12.0)
+        marker = detector.detect_list_marker(line)
 
-    def test_detect_parenthetical_markers(self, detector):
-        """Test detection of parenthetical list markers."""
-        paren_tests = [
-            ("(1) First item", "1", "(", ") "),
-            ("(2) Second item", "2", "(", ") "),
-            ("(a) First item", "a", "(", ") "),
-            ("(b) Second item", "b", "(", ") "),
-            ("(i) First item", "i", "(", ") "),
-            ("(ii) Second item", "ii", "(", ") "),
-        ]
-        
-        for text, expected_symbol, expected_prefix, expected_suffix in paren_tests:
-            line = Line(text, 100.0, 50.0, 12.0)
-            marker = detector.detect_list_marker(line)
-            
-            assert marker is not None, f"Failed to detect marker in '{text}'"
-            assert marker.marker_type == ListType.ORDERED
-            assert marker.symbol == expected_symbol
-            assert marker.prefix == expected_prefix
-            assert marker.suffix == expected_suffix
+        assert marker is not None, f"Failed to detect marker in '{text}'"
+        assert marker.marker_type == ListType.ORDERED
+        assert marker.symbol == expected_symbol
+        assert marker.prefix == expected_prefix
+        assert marker.suffix == expected_suffix
 
     def test_no_marker_detection(self, detector):
         """Test that non-list lines are not detected as having markers."""
@@ -295,4 +253,58 @@ class TestListDetector:
         
         # Both should be at level 0
         assert list_items[0].level == 0
-        assert list_items[1].level == 0
\ No newline at end of file
+        assert list_items[1].level == 0
+
+    def test_marker_detection_is_memoized_by_text(self, detector):
+        """Test that repeated lookups for the same text reuse the detected marker."""
+        first = detector.detect_list_marker(Line("1. First item", 100.0, 50.0, 12.0))
+        # Same text at a different position yields the cached marker
+        second = detector.detect_list_marker(Line("1. First item", 80.0, 70.0, 12.0))
+
+        assert first is second
+        assert detector.is_list_marker_line(Line("1. First item", 60.0, 50.0, 12.0))
+        assert not detector.is_list_marker_line(Line("Plain text", 60.0, 50.0, 12.0))
+        assert detector.detect_list_marker(Line("Plain text", 40.0, 50.0, 12.0)) is None
+
+    def test_prefilter_skips_prose_but_keeps_unicode_digits(self, detector):
+        """Test that the first-character prefilter agrees with the marker patterns."""
+        assert detector.detect_list_marker(Line("“Quoted prose”", 100.0, 50.0, 12.0)) is None
+        assert detector.detect_list_marker(Line("   ... trailing thought", 100.0, 50.0, 12.0)) is None
+
+        # \d in the ordered patterns is Unicode aware, so the prefilter must be too
+        marker = detector.detect_list_marker(Line("٣. Arabic-Indic numbered item", 100.0, 50.0, 12.0))
+        assert marker is not None
+        assert marker.symbol == "٣"
+
+    def test_markers_are_shared_across_detectors(self, detector):
+        """Test that equal markers detected by different detectors are the same pooled object."""
+        other = ListDetector()
+
+        first = detector.detect_list_marker(Line("• First item", 100.0, 50.0, 12.0))
+        second = other.detect_list_marker(Line("• Second item", 85.0, 50.0, 12.0))
+
+        assert first is second
+
+    def test_numeric_markers_are_not_pooled(self, detector):
+        """Test that arbitrary numbers do not grow the shared marker pool."""
+        pool_size = len(_MARKER_POOL)
+
+        marker = detector.detect_list_marker(Line("98765. Numbered item", 100.0, 50.0, 12.0))
+
+        assert marker.symbol == "98765"
+        assert len(_MARKER_POOL) == pool_size
+
+    def test_group_list_items_splits_on_large_level_gap(self, detector):
+        """Test that a same-type run is split when nesting jumps by more than two levels."""
+        marker_bullet = ListMarker(ListType.UNORDERED, "•", "", " ")
+
+        list_items = [
+            ListItem("Top level", 0, marker_bullet),
+            ListItem("Deeply nested", 3, marker_bullet),
+            ListItem("Nested sibling", 2, marker_bullet),
+        ]
+
+        blocks = detector.group_list_items_into_blocks(list_items)
+
+        assert [len(block.items) for block in blocks] == [1, 2]
+        assert all(block.list_type == ListType.UNORDERED for block in blocks)
@@ -0,0 +1,34 @@
+"""Shared fixtures for infrastructure unit tests."""
+
+import pytest
+
+from pdf2markdown.infrastructure.formatters import MarkdownFormatter
+from pdf2markdown.infrastructure.parsers import PdfMinerParser
+
+
+@pytest.fixture(scope="session")
+def markdown_formatter():
+    """Provide one MarkdownFormatter for the session; tests never mutate it."""
+    return MarkdownFormatter()
+
+
+@pytest.fixture(scope="session")
+def pdfminer_parser():
+    """Provide one PdfMinerParser for the session; tests never mutate it."""
+    return PdfMinerParser()
+
+
+@pytest.fixture(scope="session")
+def pdf_path(tmp_path_factory):
+    """Provide one empty .pdf file for tests that stub out the actual extraction."""
+    path = tmp_path_factory.mktemp("pdfs") / "sample.pdf"
+    path.touch()
+    return path
+
+
+@pytest.fixture
+def mock_extract(monkeypatch):
+    """Stub a parser class's extract_text_elements to yield the given elements."""
+    def _install(parser_cls, elements):
+        monkeypatch.setattr(parser_cls, "extract_text_elements", lambda self, file_path: iter(elements))
+    return _install
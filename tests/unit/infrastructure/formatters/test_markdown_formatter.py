@@ -1,21 +1,58 @@
 """Unit tests for markdown formatter."""
 
-import tempfile
-from pathlib import Path
+import io
 
 import pytest
 
 from pdf2markdown.domain.models import Document, Heading, TextBlock
 from pdf2markdown.infrastructure.formatters import MarkdownFormatter
 
+HEADING_HIERARCHY = [
+    (1, "H1 Title"),
+    (2, "H2 Subtitle"),
+    (3, "H3 Section"),
+    (4, "H4 Subsection"),
+    (5, "H5 Minor"),
+    (6, "H6 Tiny"),
+]
+
+# Expected markdown output for the multi-block documents built below
+_EXPECTED_HEADINGS_AND_TEXT = """# Main Document
+
+## Introduction
+
+This is the introduction paragraph.
+### Details
+
+Here are the details."""
+
+_EXPECTED_COMPLEX = """# Chapter 1
+
+First paragraph content.
+## Section A
+
+Section A content.
+## Section B
+
+Section B content.
+### Subsection
+
+Subsection content."""
+
+_EXPECTED_FILE_OUTPUT = """# Test Document
+
+## Heading
+
+Content here."""
+
+_EXPECTED_WITH_METADATA = """# Document with Metadata
+
+Document content."""
+
 
 class TestMarkdownFormatter:
     """Test suite for MarkdownFormatter."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.formatter = MarkdownFormatter()
-    
     def test_formatter_initialization(self):
         """Test formatter initializes correctly."""
         # Arrange & Act
@@ -25,40 +62,40 @@ class TestMarkdownFormatter:
         assert formatter.logger is not None
         assert formatter.logger.name == "pdf2markdown.infrastructure.formatters.markdown_formatter"
     
-    def test_format_document_empty(self):
+    def test_format_document_empty(self, markdown_formatter):
         """Test formatting empty document."""
         # Arrange
         document = Document()
         
         # Act
-        result = self.formatter.format_document(document)
+        result = markdown_formatter.format_document(document)
         
         # Assert
         assert result == ""
     
-    def test_format_document_none(self):
+    def test_format_document_none(self, markdown_formatter):
         """Test formatting None document."""
         # Arrange
         document = None
         
         # Act
-        result = self.formatter.format_document(document)
+        result = markdown_formatter.format_document(document)
         
         # Assert
         assert result == ""
     
-    def test_format_document_with_title_only(self):
+    def test_format_document_with_title_only(self, markdown_formatter):
         """Test formatting document with only title."""
         # Arrange
         document = Document(title="Test Document")
         
         # Act
-        result = self.formatter.format_document(document)
+        result = markdown_formatter.format_document(document)
         
         # Assert
         assert result == "# Test Document"
     
-    def test_format_document_with_headings_and_text(self):
+    def test_format_document_with_headings_and_text(self, markdown_formatter):
         """Test formatting document with headings and text blocks."""
         # Arrange
         document = Document(title="Main Document")
@@ -68,20 +105,12 @@ class TestMarkdownFormatter:
         document.add_block(TextBlock(content="Here are the details."))
         
         # Act
-        result = self.formatter.format_document(document)
+        result = markdown_formatter.format_document(document)
         
         # Assert
-        expected = """# Main Document
-
-## Introduction
-
-This is the introduction paragraph.
-### Details
-
-Here are the details."""
-        assert result == expected
+        assert result == _EXPECTED_HEADINGS_AND_TEXT
     
-    def test_format_document_complex(self):
+    def test_format_document_complex(self, markdown_formatter):
         """Test formatting complex document with multiple elements."""
         # Arrange
         document = Document()
@@ -95,62 +124,66 @@ Here are the details."""
         document.add_block(TextBlock(content="Subsection content."))
         
         # Act
-        result = self.formatter.format_document(document)
+        result = markdown_formatter.format_document(document)
         
         # Assert
-        expected = """# Chapter 1
+        assert result == _EXPECTED_COMPLEX
 
-First paragraph content.
-## Section A
+    def test_format_to_stream(self, markdown_formatter):
+        """Test markdown is written to an in-memory stream."""
+        # Arrange
+        document = Document(title="Test Document")
+        document.add_block(Heading(level=2, content="Heading"))
+        document.add_block(TextBlock(content="Content here."))
+        stream = io.StringIO()
 
-Section A content.
-## Section B
+        # Act
+        markdown_formatter.format_to_stream(document, stream)
 
-Section B content.
-### Subsection
+        # Assert
+        assert stream.getvalue() == _EXPECTED_FILE_OUTPUT
 
-Subsection content."""
-        assert result == expected
-    
-    def test_format_to_file_success(self):
+    def test_format_to_file_success(self, markdown_formatter, tmp_path):
         """Test successful file output."""
         # Arrange
         document = Document(title="Test Document")
         document.add_block(Heading(level=2, content="Heading"))
         document.add_block(TextBlock(content="Content here."))
+        output_path = tmp_path / "output.md"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as temp_file:
-            temp_path = temp_file.name
+        # Act
+        markdown_formatter.format_to_file(document, str(output_path))
         
-        try:
-            # Act
-            self.formatter.format_to_file(document, temp_path)
-            
-            # Assert
-            with open(temp_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            expected = """# Test Document
-
-## Heading
-
-Content here."""
-            assert content == expected
-            
-        finally:
-            Path(temp_path).unlink()
+        # Assert
+        assert output_path.read_text(encoding='utf-8') == _EXPECTED_FILE_OUTPUT
     
-    def test_format_to_file_invalid_path(self):
+    def test_format_to_file_invalid_path(self, markdown_formatter, tmp_path):
         """Test file output with invalid path raises IOError."""
         # Arrange
         document = Document(title="Test")
-        invalid_path = "/invalid/directory/file.md"
+        invalid_path = str(tmp_path / "missing" / "file.md")
+
+        # Act & Assert
+        with pytest.raises(IOError, match="Failed to write markdown file"):
+            markdown_formatter.format_to_file(document, invalid_path)
+
+    def test_format_to_file_failure_keeps_existing_file(self, markdown_formatter, tmp_path, monkeypatch):
+        """Test a formatting error leaves a pre-existing output file untouched."""
+        # Arrange
+        output_path = tmp_path / "existing.md"
+        output_path.write_text("Existing content", encoding='utf-8')
+
+        def failing_format(document):
+            raise ValueError("formatting failed")
+
+        monkeypatch.setattr(markdown_formatter, "format_document", failing_format)
         
         # Act & Assert
         with pytest.raises(IOError, match="Failed to write markdown file"):
-            self.formatter.format_to_file(document, invalid_path)
+            markdown_formatter.format_to_file(Document(title="Test"), str(output_path))
+        assert output_path.read_text(encoding='utf-8') == "Existing content"
     
-    def test_format_document_with_metadata(self):
+    def test_format_document_with_metadata(self, markdown_formatter):
         """Test that formatting works with document metadata."""
         # Arrange
         document = Document(
@@ -164,39 +197,37 @@ Content here."""
         document.add_block(TextBlock(content="Document content."))
         
         # Act
-        result = self.formatter.format_document(document)
+        result = markdown_formatter.format_document(document)
         
         # Assert
         # Metadata is not included in markdown output by default
-        expected = """# Document with Metadata
-
-Document content."""
-        assert result == expected
+        assert result == _EXPECTED_WITH_METADATA
     
-    def test_format_document_preserves_heading_hierarchy(self):
+    @pytest.mark.parametrize("level,content", HEADING_HIERARCHY)
+    def test_format_document_preserves_heading_hierarchy(self, markdown_formatter, level, content):
         """Test that heading hierarchy is preserved in output."""
         # Arrange
         document = Document()
-        document.add_block(Heading(level=1, content="H1 Title"))
-        document.add_block(Heading(level=2, content="H2 Subtitle"))
-        document.add_block(Heading(level=3, content="H3 Section"))
-        document.add_block(Heading(level=4, content="H4 Subsection"))
-        document.add_block(Heading(level=5, content="H5 Minor"))
-        document.add_block(Heading(level=6, content="H6 Tiny"))
+        for heading_level, heading_content in HEADING_HIERARCHY:
+            document.add_block(Heading(level=heading_level, content=heading_content))
         
         # Act
-        result = self.formatter.format_document(document)
+        result = markdown_formatter.format_document(document)
         
         # Assert
-        expected = """# H1 Title
-
-## H2 Subtitle
+        # Headings are separated by blank lines, so each one sits on every other line
+        assert result.split("\n")[(level - 1) * 2] == f"{'#' * level} {content}"
 
-### H3 Section
-
-#### H4 Subsection
+    def test_format_document_renders_full_heading_hierarchy(self, markdown_formatter):
+        """Test the complete output for all heading levels, including separators."""
+        # Arrange
+        document = Document()
+        for level, content in HEADING_HIERARCHY:
+            document.add_block(Heading(level=level, content=content))
+        expected = "\n\n".join(f"{'#' * level} {content}" for level, content in HEADING_HIERARCHY)
 
-##### H5 Minor
+        # Act
+        result = markdown_formatter.format_document(document)
 
-###### H6 Tiny"""
-        assert result == expected
\ No newline at end of file
+        # Assert
+        assert result == expected
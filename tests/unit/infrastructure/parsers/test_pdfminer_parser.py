@@ -1,9 +1,10 @@
 """Unit tests for PDFMiner parser implementation."""
 
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
-from typing import Iterator
+from typing import Callable
+from typing import NamedTuple
+from typing import Optional
+from typing import Type
 
 import pytest
 
@@ -11,14 +12,59 @@ from pdf2markdown.domain.interfaces import TextElement
 from pdf2markdown.domain.models import Document, TextBlock
 from pdf2markdown.infrastructure.parsers import PdfMinerParser
 
+# TextElement is an immutable NamedTuple, so these can be shared between tests
+_SUCCESS_ELEMENTS = (
+    TextElement(
+        content="Title Text",
+        font_size=16.0,
+        font_name="Arial-Bold",
+        is_bold=True,
+        page_number=1
+    ),
+    TextElement(
+        content="Body paragraph with sufficient length to pass filtering.",
+        font_size=12.0,
+        font_name="Arial-Regular",
+        page_number=1
+    ),
+)
+
+_SHORT_ELEMENTS = (
+    TextElement(content="A", font_size=12.0, page_number=1),  # Too short
+    TextElement(content="B", font_size=12.0, page_number=1),  # Too short
+    TextElement(content="This is long enough content", font_size=12.0, page_number=1),  # Long enough
+)
+
+_EMPTY_ELEMENTS = (
+    TextElement(content="   ", font_size=12.0, page_number=1),  # Whitespace only
+    TextElement(content="", font_size=12.0, page_number=1),     # Empty
+)
+
+
+def _missing_pdf(tmp_path):
+    """Return a PDF path that does not exist."""
+    return Path("/non/existent/file.pdf")
+
+
+def _text_file(tmp_path):
+    """Create an empty file without a .pdf extension."""
+    path = tmp_path / "sample.txt"
+    path.touch()
+    return path
+
+
+class _RejectCase(NamedTuple):
+    """An invalid input and the error the parser must raise for it."""
+
+    make_path: Callable[[Path], Path]
+    parse: bool
+    exc: Type[Exception]
+    pattern: Optional[str]
+
 
 class TestPdfMinerParser:
     """Test suite for PDFMiner parser implementation."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = PdfMinerParser()
-    
     def test_parser_initialization(self):
         """Test parser initializes correctly."""
         # Arrange & Act
@@ -28,142 +74,80 @@ class TestPdfMinerParser:
         assert parser.logger is not None
         assert parser.logger.name == "pdf2markdown.infrastructure.parsers.pdfminer_parser"
     
-    def test_extract_text_elements_file_not_found(self):
-        """Test extraction fails when file doesn't exist."""
+    @pytest.mark.parametrize("case", [
+        pytest.param(_RejectCase(_missing_pdf, False, IOError, "File not found"), id="extract-missing-file"),
+        pytest.param(_RejectCase(_text_file, False, ValueError, "File is not a PDF"), id="extract-invalid-extension"),
+        pytest.param(_RejectCase(_missing_pdf, True, IOError, None), id="parse-missing-file"),
+    ])
+    def test_parser_rejects_invalid_input(self, pdfminer_parser, tmp_path, case):
+        """Test extraction and parsing fail for missing and non-PDF files."""
         # Arrange
-        non_existent_file = Path("/non/existent/file.pdf")
+        path = case.make_path(tmp_path)
         
         # Act & Assert
-        with pytest.raises(IOError, match="File not found"):
-            list(self.parser.extract_text_elements(non_existent_file))
+        with pytest.raises(case.exc, match=case.pattern):
+            if case.parse:
+                pdfminer_parser.parse_document(path)
+            else:
+                list(pdfminer_parser.extract_text_elements(path))
     
-    def test_extract_text_elements_invalid_extension(self):
-        """Test extraction fails for non-PDF files."""
-        # Arrange
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        try:
-            # Act & Assert
-            with pytest.raises(ValueError, match="File is not a PDF"):
-                list(self.parser.extract_text_elements(temp_path))
-        finally:
-            temp_path.unlink()
-    
-    def test_font_style_detection_logic(self):
+    @pytest.mark.parametrize("font_name,expected_bold,expected_italic", [
+        ("Arial-Bold", True, False),
+        ("Times-Italic", False, True),
+        ("Helvetica-BoldItalic", True, True),
+        ("Georgia-Regular", False, False),
+        ("SomeFont-Black", True, False),
+        ("AnotherFont-Oblique", False, True),
+        ("Normal-Font", False, False),
+        ("Heavy-Font", True, False),
+    ])
+    def test_font_style_detection_logic(self, font_name, expected_bold, expected_italic):
         """Test font style detection logic without complex mocking."""
-        # Test the font name parsing logic directly
-        test_cases = [
-            ("Arial-Bold", True, False),
-            ("Times-Italic", False, True),
-            ("Helvetica-BoldItalic", True, True),
-            ("Georgia-Regular", False, False),
-            ("SomeFont-Black", True, False),
-            ("AnotherFont-Oblique", False, True),
-            ("Normal-Font", False, False),
-            ("Heavy-Font", True, False),
-        ]
+        # Test the logic used in the parser directly
+        font_name_lower = font_name.lower()
+        is_bold = any(indicator in font_name_lower for indicator in ['bold', 'black', 'heavy'])
+        is_italic = any(indicator in font_name_lower for indicator in ['italic', 'oblique'])
         
-        for font_name, expected_bold, expected_italic in test_cases:
-            # Test the logic used in the parser directly
-            font_name_lower = font_name.lower()
-            is_bold = any(indicator in font_name_lower for indicator in ['bold', 'black', 'heavy'])
-            is_italic = any(indicator in font_name_lower for indicator in ['italic', 'oblique'])
-            
-            assert is_bold == expected_bold, f"Font {font_name} bold detection failed"
-            assert is_italic == expected_italic, f"Font {font_name} italic detection failed"
+        assert is_bold == expected_bold, f"Font {font_name} bold detection failed"
+        assert is_italic == expected_italic, f"Font {font_name} italic detection failed"
     
-    @patch.object(PdfMinerParser, 'extract_text_elements')
-    def test_parse_document_success(self, mock_extract_text_elements):
+    def test_parse_document_success(self, mock_extract, pdfminer_parser, pdf_path):
         """Test successful document parsing using mocked extract_text_elements."""
         # Arrange
-        mock_elements = [
-            TextElement(
-                content="Title Text",
-                font_size=16.0,
-                font_name="Arial-Bold",
-                is_bold=True,
-                page_number=1
-            ),
-            TextElement(
-                content="Body paragraph with sufficient length to pass filtering.",
-                font_size=12.0,
-                font_name="Arial-Regular",
-                page_number=1
-            )
-        ]
-        mock_extract_text_elements.return_value = iter(mock_elements)
+        mock_extract(PdfMinerParser, _SUCCESS_ELEMENTS)
         
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
+        # Act
+        document = pdfminer_parser.parse_document(pdf_path)
         
-        try:
-            # Act
-            document = self.parser.parse_document(temp_path)
-            
-            # Assert
-            assert isinstance(document, Document)
-            assert len(document.blocks) == 2
-            assert isinstance(document.blocks[0], TextBlock)
-            assert document.blocks[0].content == "Title Text"
-            assert document.blocks[0].font_size == 16.0
-            assert document.blocks[1].content == "Body paragraph with sufficient length to pass filtering."
-            assert document.metadata['source_file'] == str(temp_path)
-            assert document.metadata['parser'] == 'pdfminer'
-        finally:
-            temp_path.unlink()
+        # Assert
+        assert isinstance(document, Document)
+        assert len(document.blocks) == 2
+        assert isinstance(document.blocks[0], TextBlock)
+        assert document.blocks[0].content == "Title Text"
+        assert document.blocks[0].font_size == 16.0
+        assert document.blocks[1].content == "Body paragraph with sufficient length to pass filtering."
+        assert document.metadata['source_file'] == str(pdf_path)
+        assert document.metadata['parser'] == 'pdfminer'
     
-    @patch.object(PdfMinerParser, 'extract_text_elements')
-    def test_parse_document_filters_short_content(self, mock_extract_text_elements):
+    def test_parse_document_filters_short_content(self, mock_extract, pdfminer_parser, pdf_path):
         """Test that very short content is filtered out."""
         # Arrange
-        mock_elements = [
-            TextElement(content="A", font_size=12.0, page_number=1),  # Too short
-            TextElement(content="B", font_size=12.0, page_number=1),  # Too short
-            TextElement(content="This is long enough content", font_size=12.0, page_number=1),  # Long enough
-        ]
-        mock_extract_text_elements.return_value = iter(mock_elements)
-        
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
+        mock_extract(PdfMinerParser, _SHORT_ELEMENTS)
         
-        try:
-            # Act
-            document = self.parser.parse_document(temp_path)
-            
-            # Assert
-            assert len(document.blocks) == 1  # Only the long content should be included
-            assert document.blocks[0].content == "This is long enough content"
-        finally:
-            temp_path.unlink()
-    
-    def test_parse_document_file_not_found(self):
-        """Test document parsing fails when file doesn't exist."""
-        # Arrange
-        non_existent_file = Path("/non/existent/file.pdf")
+        # Act
+        document = pdfminer_parser.parse_document(pdf_path)
         
-        # Act & Assert
-        with pytest.raises(IOError):
-            self.parser.parse_document(non_existent_file)
+        # Assert
+        assert len(document.blocks) == 1  # Only the long content should be included
+        assert document.blocks[0].content == "This is long enough content"
     
-    @patch.object(PdfMinerParser, 'extract_text_elements')
-    def test_parse_document_handles_empty_content(self, mock_extract_text_elements):
+    def test_parse_document_handles_empty_content(self, mock_extract, pdfminer_parser, pdf_path):
         """Test document parsing with empty or whitespace-only content."""
         # Arrange
-        mock_elements = [
-            TextElement(content="   ", font_size=12.0, page_number=1),  # Whitespace only
-            TextElement(content="", font_size=12.0, page_number=1),     # Empty
-        ]
-        mock_extract_text_elements.return_value = iter(mock_elements)
+        mock_extract(PdfMinerParser, _EMPTY_ELEMENTS)
         
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
+        # Act
+        document = pdfminer_parser.parse_document(pdf_path)
         
-        try:
-            # Act
-            document = self.parser.parse_document(temp_path)
-            
-            # Assert
-            assert len(document.blocks) == 0  # No blocks should be created
-        finally:
-            temp_path.unlink()
\ No newline at end of file
+        # Assert
+        assert len(document.blocks) == 0  # No blocks should be created
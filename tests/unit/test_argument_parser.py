@@ -5,10 +5,12 @@ Tests argument parsing, validation, and error handling functionality
 following the AAA pattern with comprehensive coverage of edge cases.
 """
 
-import tempfile
+import os
+from dataclasses import FrozenInstanceError
 from pathlib import Path
-from unittest.mock import Mock
-from unittest.mock import patch
+from typing import Callable
+from typing import Dict
+from typing import List
 
 import pytest
 
@@ -17,7 +19,56 @@ from pdf2markdown.cli.argument_parser import CliArguments
 from pdf2markdown.cli.argument_parser import create_argument_parser
 from pdf2markdown.core.config import ApplicationConfig
 from pdf2markdown.core.config import ProcessingConfig
-from pdf2markdown.core.exceptions import ValidationError
+from pdf2markdown.core.exceptions import ErrorCode
+
+
+@pytest.fixture(scope="module")
+def pdf_fixtures(tmp_path_factory):
+    """Provide a shared temp directory holding an empty test.pdf for the module."""
+    temp_dir = tmp_path_factory.mktemp("argparse")
+    test_pdf = temp_dir / "test.pdf"
+    test_pdf.touch()  # Argument validation only checks path, size and permissions
+    return temp_dir, test_pdf
+
+
+@pytest.fixture(scope="module")
+def parser(default_app_config) -> ArgumentParser:
+    """Provide one ArgumentParser for the module; parsing never mutates it."""
+    return ArgumentParser(default_app_config)
+
+
+def _nonexistent_file_argv(tmp_path: Path, test_pdf: Path) -> List[str]:
+    return [str(tmp_path / "nonexistent.pdf")]
+
+
+def _directory_argv(tmp_path: Path, test_pdf: Path) -> List[str]:
+    directory = tmp_path / "directory.pdf"
+    directory.mkdir()
+    return [str(directory)]
+
+
+def _wrong_extension_argv(tmp_path: Path, test_pdf: Path) -> List[str]:
+    text_file = tmp_path / "document.txt"
+    text_file.write_text("not a pdf")
+    return [str(text_file)]
+
+
+def _missing_arguments_argv(tmp_path: Path, test_pdf: Path) -> List[str]:
+    return []
+
+
+def _invalid_option_argv(tmp_path: Path, test_pdf: Path) -> List[str]:
+    return [str(test_pdf), "--invalid-option"]
+
+
+# Command lines that argparse must reject, keyed by case id
+_REJECTED_ARGV: Dict[str, Callable[[Path, Path], List[str]]] = {
+    "nonexistent": _nonexistent_file_argv,
+    "directory": _directory_argv,
+    "wrong_ext": _wrong_extension_argv,
+    "missing": _missing_arguments_argv,
+    "invalid_opt": _invalid_option_argv,
+}
 
 
 class TestCliArguments:
@@ -86,29 +137,32 @@ class TestCliArguments:
         # Assert
         assert args.output_file == Path("/path/to/document.md")
 
-    def test_validates_verbose_and_quiet_conflict(self) -> None:
+    def test_validates_verbose_and_quiet_conflict(self, assert_raises_field) -> None:
         """Test validation of conflicting verbose and quiet options."""
         # Arrange
         input_file = Path("test.pdf")
 
         # Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
+        with assert_raises_field(ErrorCode.CONFLICTING_OPTIONS, "output_mode"):
             CliArguments(input_file, verbose=True, quiet=True)
 
-        assert "Cannot specify both --verbose and --quiet" in str(exc_info.value)
-        assert exc_info.value.details["field"] == "output_mode"
-
-    def test_validates_input_file_extension(self) -> None:
+    def test_validates_input_file_extension(self, assert_raises_field) -> None:
         """Test validation of input file extension."""
         # Arrange
         input_file = Path("document.txt")
 
         # Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
+        with assert_raises_field(ErrorCode.INVALID_EXTENSION, "input_file"):
             CliArguments(input_file)
 
-        assert "Input file must have .pdf extension" in str(exc_info.value)
-        assert exc_info.value.details["field"] == "input_file"
+    def test_is_immutable(self) -> None:
+        """Test that parsed arguments cannot be reassigned."""
+        # Arrange
+        args = CliArguments(Path("test.pdf"))
+
+        # Act & Assert
+        with pytest.raises(FrozenInstanceError):
+            args.force = True
 
     def test_to_dict_returns_serializable_representation(self) -> None:
         """Test that to_dict returns a serializable dictionary."""
@@ -142,44 +196,31 @@ class TestCliArguments:
 class TestArgumentParser:
     """Test suite for ArgumentParser class."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.config = ApplicationConfig()
-        self.parser = ArgumentParser(self.config)
-
-        # Create temporary PDF file for testing
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.test_pdf = self.temp_dir / "test.pdf"
-        self.test_pdf.write_bytes(b"%PDF-1.4\n%EOF\n")  # Minimal PDF content
-
-    def teardown_method(self) -> None:
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_parses_minimal_arguments(self) -> None:
+    def test_parses_minimal_arguments(self, pdf_fixtures, parser) -> None:
         """Test parsing minimal required arguments."""
         # Arrange
-        args = [str(self.test_pdf)]
+        _, test_pdf = pdf_fixtures
+        args = [str(test_pdf)]
 
         # Act
-        result = self.parser.parse_args(args)
+        result = parser.parse_args(args)
 
         # Assert
         assert isinstance(result, CliArguments)
-        assert result.input_file == self.test_pdf
-        assert result.output_file == self.test_pdf.with_suffix('.md')
+        assert result.input_file == test_pdf
+        assert result.output_file == test_pdf.with_suffix('.md')
         assert result.debug is False
         assert result.verbose is False
         assert result.quiet is False
         assert result.force is False
 
-    def test_parses_all_arguments(self) -> None:
+    def test_parses_all_arguments(self, pdf_fixtures, parser) -> None:
         """Test parsing all available arguments."""
         # Arrange
-        output_file = self.temp_dir / "output.md"
+        temp_dir, test_pdf = pdf_fixtures
+        output_file = temp_dir / "output.md"
         args = [
-            str(self.test_pdf),
+            str(test_pdf),
             "--output", str(output_file),
             "--debug",
             "--verbose",
@@ -187,167 +228,125 @@ class TestArgumentParser:
         ]
 
         # Act
-        result = self.parser.parse_args(args)
+        result = parser.parse_args(args)
 
         # Assert
-        assert result.input_file == self.test_pdf
+        assert result.input_file == test_pdf
         assert result.output_file == output_file
         assert result.debug is True
         assert result.verbose is True
         assert result.force is True
 
-    def test_parses_short_options(self) -> None:
+    def test_parses_short_options(self, pdf_fixtures, parser) -> None:
         """Test parsing short option forms."""
         # Arrange
-        output_file = self.temp_dir / "output.md"
+        temp_dir, test_pdf = pdf_fixtures
+        output_file = temp_dir / "output.md"
         args = [
-            str(self.test_pdf),
+            str(test_pdf),
             "-o", str(output_file),
             "-v",
             "-f"
         ]
 
         # Act
-        result = self.parser.parse_args(args)
+        result = parser.parse_args(args)
 
         # Assert
-        assert result.input_file == self.test_pdf
+        assert result.input_file == test_pdf
         assert result.output_file == output_file
         assert result.verbose is True
         assert result.quiet is False
         assert result.force is True
 
-    def test_validates_input_file_exists(self) -> None:
-        """Test validation that input file must exist."""
+    @pytest.mark.parametrize("case", list(_REJECTED_ARGV))
+    def test_rejects_invalid_command_line(self, case, pdf_fixtures, parser, tmp_path) -> None:
+        """Test that invalid input files and options make argparse exit with an error."""
         # Arrange
-        non_existent_file = self.temp_dir / "nonexistent.pdf"
-        args = [str(non_existent_file)]
+        _, test_pdf = pdf_fixtures
+        args = _REJECTED_ARGV[case](tmp_path, test_pdf)
 
         # Act & Assert
-        with pytest.raises(SystemExit):  # argparse raises SystemExit
-            self.parser.parse_args(args)
-
-    def test_validates_input_file_is_regular_file(self) -> None:
-        """Test validation that input must be a regular file."""
-        # Arrange
-        directory = self.temp_dir / "directory.pdf"
-        directory.mkdir()
-        args = [str(directory)]
+        with pytest.raises(SystemExit) as exc_info:  # argparse raises SystemExit
+            parser.parse_args(args)
 
-        # Act & Assert
-        with pytest.raises(SystemExit):  # argparse raises SystemExit
-            self.parser.parse_args(args)
-
-    def test_validates_input_file_extension(self) -> None:
-        """Test validation of input file extension."""
-        # Arrange
-        text_file = self.temp_dir / "document.txt"
-        text_file.write_text("not a pdf")
-        args = [str(text_file)]
-
-        # Act & Assert
-        with pytest.raises(SystemExit):  # argparse raises SystemExit
-            self.parser.parse_args(args)
+        # SystemExit with non-zero code indicates error
+        assert exc_info.value.code != 0
 
-    def test_validates_file_size_limit(self) -> None:
+    def test_validates_file_size_limit(self, tmp_path) -> None:
         """Test validation of file size limits."""
         # Arrange
-        # Create a large file that exceeds the limit
-        large_file = self.temp_dir / "large.pdf"
-        large_size = self.config.processing.max_file_size_mb * 1024 * 1024 + 1
-
-        with open(large_file, 'wb') as f:
-            f.write(b"%PDF-1.4\n")
-            f.seek(large_size - 1)
-            f.write(b"\0")
+        # A 1MB limit keeps the oversized file small; truncate extends it sparsely
+        config = ApplicationConfig(processing=ProcessingConfig(max_file_size_mb=1))
+        parser = ArgumentParser(config)
+        large_file = tmp_path / "large.pdf"
+        large_file.write_bytes(b"%PDF-1.4\n")
+        os.truncate(large_file, config.processing.max_file_size_mb * 1024 * 1024 + 1)
 
         args = [str(large_file)]
 
         # Act & Assert
         with pytest.raises(SystemExit):  # argparse raises SystemExit
-            self.parser.parse_args(args)
+            parser.parse_args(args)
 
-    @patch('os.access')
-    def test_validates_file_permissions(self, mock_access: Mock) -> None:
+    def test_validates_file_permissions(self, monkeypatch, pdf_fixtures, parser) -> None:
         """Test validation of file read permissions."""
         # Arrange
-        mock_access.return_value = False  # Simulate no read permission
-        args = [str(self.test_pdf)]
+        _, test_pdf = pdf_fixtures
+        monkeypatch.setattr(os, "access", lambda *args, **kwargs: False)  # Simulate no read permission
+        args = [str(test_pdf)]
 
         # Act & Assert
         with pytest.raises(SystemExit):  # argparse raises SystemExit
-            self.parser.parse_args(args)
+            parser.parse_args(args)
 
-    def test_print_help_outputs_usage(self, capsys) -> None:
+    def test_print_help_outputs_usage(self, parser, monkeypatch) -> None:
         """Test that print_help outputs usage information."""
-        # Arrange & Act
-        self.parser.print_help()
+        # Arrange
+        messages = []
+        monkeypatch.setattr(parser._parser, "_print_message", lambda message, file=None: messages.append(message))
+
+        # Act
+        parser.print_help()
 
         # Assert
-        captured = capsys.readouterr()
-        assert "pdf2md" in captured.out
-        assert "Convert PDF documents" in captured.out
-        assert "usage:" in captured.out.lower()
+        output = "".join(messages)
+        assert "pdf2md" in output
+        assert "Convert PDF documents" in output
+        assert "usage:" in output.lower()
 
-    def test_version_option_displays_version(self) -> None:
+    def test_version_option_displays_version(self, parser) -> None:
         """Test that --version displays version information."""
         # Arrange
         args = ["--version"]
 
         # Act & Assert
         with pytest.raises(SystemExit) as exc_info:
-            self.parser.parse_args(args)
+            parser.parse_args(args)
 
         # SystemExit with code 0 indicates success (version displayed)
         assert exc_info.value.code == 0
 
-    def test_help_option_displays_help(self) -> None:
+    def test_help_option_displays_help(self, parser) -> None:
         """Test that --help displays help information."""
         # Arrange
         args = ["--help"]
 
         # Act & Assert
         with pytest.raises(SystemExit) as exc_info:
-            self.parser.parse_args(args)
+            parser.parse_args(args)
 
         # SystemExit with code 0 indicates success (help displayed)
         assert exc_info.value.code == 0
 
-    def test_handles_missing_arguments(self) -> None:
-        """Test handling of missing required arguments."""
-        # Arrange
-        args = []
-
-        # Act & Assert
-        with pytest.raises(SystemExit) as exc_info:
-            self.parser.parse_args(args)
-
-        # SystemExit with non-zero code indicates error
-        assert exc_info.value.code != 0
-
-    def test_handles_invalid_options(self) -> None:
-        """Test handling of invalid command-line options."""
-        # Arrange
-        args = [str(self.test_pdf), "--invalid-option"]
-
-        # Act & Assert
-        with pytest.raises(SystemExit) as exc_info:
-            self.parser.parse_args(args)
-
-        # SystemExit with non-zero code indicates error
-        assert exc_info.value.code != 0
-
 
 class TestCreateArgumentParser:
     """Test suite for create_argument_parser factory function."""
 
-    def test_creates_argument_parser_instance(self) -> None:
+    def test_creates_argument_parser_instance(self, default_app_config) -> None:
         """Test that factory creates ArgumentParser instance."""
-        # Arrange
-        config = ApplicationConfig()
-
-        # Act
-        parser = create_argument_parser(config)
+        # Arrange & Act
+        parser = create_argument_parser(default_app_config)
 
         # Assert
         assert isinstance(parser, ArgumentParser)
@@ -364,3 +363,19 @@ class TestCreateArgumentParser:
 
         # Assert
         assert parser._config.processing.max_file_size_mb == 50
+
+    def test_returns_cached_parser_for_equal_config(self, default_app_config) -> None:
+        """Test that equal configs reuse one parser and different configs do not."""
+        # Arrange
+        other_config = ApplicationConfig(
+            processing=ProcessingConfig(max_file_size_mb=50)
+        )
+
+        # Act
+        first = create_argument_parser(default_app_config)
+        second = create_argument_parser(ApplicationConfig())
+        other = create_argument_parser(other_config)
+
+        # Assert
+        assert first is second
+        assert other is not first
@@ -5,9 +5,7 @@ Tests configuration loading, validation, and environment variable handling
 following the AAA pattern with comprehensive edge case coverage.
 """
 
-import os
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -16,185 +14,162 @@ from pdf2markdown.core.config import ConfigurationManager
 from pdf2markdown.core.config import LoggingConfig
 from pdf2markdown.core.config import ProcessingConfig
 from pdf2markdown.core.exceptions import ConfigurationError
-from pdf2markdown.core.exceptions import ValidationError
+from pdf2markdown.core.exceptions import ErrorCode
+
+PROCESSING_DEFAULTS = {
+    "max_file_size_mb": 100,
+    "processing_timeout_seconds": 300,
+    "memory_limit_mb": 512,
+    "extract_tables": True,
+    "extract_images": False,
+    "preserve_formatting": True,
+    "markdown_dialect": "gfm",
+    "include_metadata": True,
+    "wrap_long_lines": True,
+    "line_length": 80,
+}
+
+PROCESSING_CUSTOM = {
+    "max_file_size_mb": 50,
+    "processing_timeout_seconds": 600,
+    "memory_limit_mb": 1024,
+    "extract_tables": False,
+    "extract_images": True,
+    "preserve_formatting": False,
+    "markdown_dialect": "commonmark",
+    "include_metadata": False,
+    "wrap_long_lines": False,
+    "line_length": 120,
+}
+
+LOGGING_DEFAULTS = {
+    "level": "INFO",
+    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    "enable_file_logging": False,
+    "log_file_path": None,
+    "max_log_file_size_mb": 10,
+    "backup_count": 3,
+}
+
+LOGGING_CUSTOM = {
+    "level": "DEBUG",
+    "format": "%(levelname)s: %(message)s",
+    "enable_file_logging": True,
+    "log_file_path": "/tmp/app.log",
+    "max_log_file_size_mb": 5,
+    "backup_count": 2,
+}
+
+APPLICATION_DEFAULTS = {
+    "app_name": "pdf2markdown",
+    "version": "1.0.0",
+    "debug": False,
+    "processing": ProcessingConfig(),
+    "logging": LoggingConfig(),
+}
+
+APPLICATION_CUSTOM = {
+    "app_name": "test-app",
+    "version": "2.0.0",
+    "debug": True,
+    "processing": ProcessingConfig(max_file_size_mb=50),
+    "logging": LoggingConfig(level="DEBUG"),
+}
+
+
+class TestConfigValues:
+    """Table-driven construction tests for the configuration value objects."""
+
+    @pytest.mark.parametrize("config_cls,kwargs,expected", [
+        pytest.param(ProcessingConfig, {}, PROCESSING_DEFAULTS, id="processing-defaults"),
+        pytest.param(ProcessingConfig, PROCESSING_CUSTOM, PROCESSING_CUSTOM, id="processing-custom"),
+        pytest.param(LoggingConfig, {}, LOGGING_DEFAULTS, id="logging-defaults"),
+        pytest.param(LoggingConfig, LOGGING_CUSTOM, LOGGING_CUSTOM, id="logging-custom"),
+        pytest.param(ApplicationConfig, {}, APPLICATION_DEFAULTS, id="application-defaults"),
+        pytest.param(ApplicationConfig, APPLICATION_CUSTOM, APPLICATION_CUSTOM, id="application-custom"),
+    ])
+    def test_creates_with_values(self, config_cls, kwargs, expected) -> None:
+        """Test that each config exposes its default or custom values."""
+        # Arrange & Act
+        config = config_cls(**kwargs)
+
+        # Assert
+        for name, value in expected.items():
+            assert getattr(config, name) == value, name
 
 
 class TestProcessingConfig:
     """Test suite for ProcessingConfig value object."""
 
-    def test_creates_with_default_values(self) -> None:
-        """Test creating ProcessingConfig with default values."""
-        # Arrange & Act
-        config = ProcessingConfig()
-
-        # Assert
-        assert config.max_file_size_mb == 100
-        assert config.processing_timeout_seconds == 300
-        assert config.memory_limit_mb == 512
-        assert config.extract_tables is True
-        assert config.extract_images is False
-        assert config.preserve_formatting is True
-        assert config.markdown_dialect == "gfm"
-        assert config.include_metadata is True
-        assert config.wrap_long_lines is True
-        assert config.line_length == 80
-
-    def test_creates_with_custom_values(self) -> None:
-        """Test creating ProcessingConfig with custom values."""
-        # Arrange & Act
-        config = ProcessingConfig(
-            max_file_size_mb=50,
-            processing_timeout_seconds=600,
-            memory_limit_mb=1024,
-            extract_tables=False,
-            extract_images=True,
-            preserve_formatting=False,
-            markdown_dialect="commonmark",
-            include_metadata=False,
-            wrap_long_lines=False,
-            line_length=120
-        )
-
-        # Assert
-        assert config.max_file_size_mb == 50
-        assert config.processing_timeout_seconds == 600
-        assert config.memory_limit_mb == 1024
-        assert config.extract_tables is False
-        assert config.extract_images is True
-        assert config.preserve_formatting is False
-        assert config.markdown_dialect == "commonmark"
-        assert config.include_metadata is False
-        assert config.wrap_long_lines is False
-        assert config.line_length == 120
-
-    def test_validates_max_file_size_mb_positive(self) -> None:
+    def test_validates_max_file_size_mb_positive(self, assert_raises_field) -> None:
         """Test validation of max_file_size_mb must be positive."""
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
+        with assert_raises_field(ErrorCode.POSITIVE_REQUIRED, "max_file_size_mb"):
             ProcessingConfig(max_file_size_mb=0)
 
-        assert "max_file_size_mb must be positive" in str(exc_info.value)
-        assert exc_info.value.details["field"] == "max_file_size_mb"
-
-    def test_validates_processing_timeout_positive(self) -> None:
+    def test_validates_processing_timeout_positive(self, assert_raises_field) -> None:
         """Test validation of processing_timeout_seconds must be positive."""
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
+        with assert_raises_field(ErrorCode.POSITIVE_REQUIRED, "processing_timeout_seconds"):
             ProcessingConfig(processing_timeout_seconds=-1)
 
-        assert "processing_timeout_seconds must be positive" in str(exc_info.value)
-        assert exc_info.value.details["field"] == "processing_timeout_seconds"
-
-    def test_validates_memory_limit_positive(self) -> None:
+    def test_validates_memory_limit_positive(self, assert_raises_field) -> None:
         """Test validation of memory_limit_mb must be positive."""
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
+        with assert_raises_field(ErrorCode.POSITIVE_REQUIRED, "memory_limit_mb"):
             ProcessingConfig(memory_limit_mb=0)
 
-        assert "memory_limit_mb must be positive" in str(exc_info.value)
-        assert exc_info.value.details["field"] == "memory_limit_mb"
-
-    def test_validates_markdown_dialect_valid(self) -> None:
+    def test_validates_markdown_dialect_valid(self, assert_raises_field) -> None:
         """Test validation of markdown_dialect must be valid."""
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
+        with assert_raises_field(ErrorCode.INVALID_CHOICE, "markdown_dialect"):
             ProcessingConfig(markdown_dialect="invalid")
 
-        assert "markdown_dialect must be one of" in str(exc_info.value)
-        assert exc_info.value.details["field"] == "markdown_dialect"
-
-    def test_validates_line_length_positive(self) -> None:
+    def test_validates_line_length_positive(self, assert_raises_field) -> None:
         """Test validation of line_length must be positive."""
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
+        with assert_raises_field(ErrorCode.POSITIVE_REQUIRED, "line_length"):
             ProcessingConfig(line_length=0)
 
-        assert "line_length must be positive" in str(exc_info.value)
-        assert exc_info.value.details["field"] == "line_length"
-
-    def test_accepts_valid_markdown_dialects(self) -> None:
-        """Test that all valid markdown dialects are accepted."""
-        # Arrange
-        valid_dialects = ["gfm", "commonmark", "basic"]
+    @pytest.mark.parametrize("dialect", ["gfm", "commonmark", "basic"])
+    def test_accepts_valid_markdown_dialect(self, dialect: str) -> None:
+        """Test that each valid markdown dialect is accepted."""
+        # Arrange & Act
+        config = ProcessingConfig(markdown_dialect=dialect)
 
-        # Act & Assert
-        for dialect in valid_dialects:
-            config = ProcessingConfig(markdown_dialect=dialect)
-            assert config.markdown_dialect == dialect
+        # Assert
+        assert config.markdown_dialect == dialect
 
 
 class TestLoggingConfig:
     """Test suite for LoggingConfig value object."""
 
-    def test_creates_with_default_values(self) -> None:
-        """Test creating LoggingConfig with default values."""
-        # Arrange & Act
-        config = LoggingConfig()
-
-        # Assert
-        assert config.level == "INFO"
-        assert "%(asctime)s" in config.format
-        assert config.enable_file_logging is False
-        assert config.log_file_path is None
-        assert config.max_log_file_size_mb == 10
-        assert config.backup_count == 3
-
-    def test_creates_with_custom_values(self) -> None:
-        """Test creating LoggingConfig with custom values."""
-        # Arrange & Act
-        config = LoggingConfig(
-            level="DEBUG",
-            format="%(levelname)s: %(message)s",
-            enable_file_logging=True,
-            log_file_path="/tmp/app.log",
-            max_log_file_size_mb=5,
-            backup_count=2
-        )
-
-        # Assert
-        assert config.level == "DEBUG"
-        assert config.format == "%(levelname)s: %(message)s"
-        assert config.enable_file_logging is True
-        assert config.log_file_path == "/tmp/app.log"
-        assert config.max_log_file_size_mb == 5
-        assert config.backup_count == 2
-
-    def test_validates_logging_level_valid(self) -> None:
+    def test_validates_logging_level_valid(self, assert_raises_field) -> None:
         """Test validation of logging level must be valid."""
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
+        with assert_raises_field(ErrorCode.INVALID_CHOICE, "level"):
             LoggingConfig(level="INVALID")
 
-        assert "Logging level must be one of" in str(exc_info.value)
-        assert exc_info.value.details["field"] == "level"
-
-    def test_validates_file_logging_requires_path(self) -> None:
+    def test_validates_file_logging_requires_path(self, assert_raises_field) -> None:
         """Test validation that file logging requires log_file_path."""
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
+        with assert_raises_field(ErrorCode.REQUIRED, "log_file_path"):
             LoggingConfig(enable_file_logging=True, log_file_path=None)
 
-        assert "log_file_path is required when file logging is enabled" in str(exc_info.value)
-        assert exc_info.value.details["field"] == "log_file_path"
-
-    def test_validates_max_log_file_size_positive(self) -> None:
+    def test_validates_max_log_file_size_positive(self, assert_raises_field) -> None:
         """Test validation of max_log_file_size_mb must be positive."""
         # Arrange & Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
+        with assert_raises_field(ErrorCode.POSITIVE_REQUIRED, "max_log_file_size_mb"):
             LoggingConfig(max_log_file_size_mb=0)
 
-        assert "max_log_file_size_mb must be positive" in str(exc_info.value)
-        assert exc_info.value.details["field"] == "max_log_file_size_mb"
-
-    def test_accepts_valid_logging_levels(self) -> None:
-        """Test that all valid logging levels are accepted."""
-        # Arrange
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+    @pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+    def test_accepts_valid_logging_level(self, level: str) -> None:
+        """Test that each valid logging level is accepted."""
+        # Arrange & Act
+        config = LoggingConfig(level=level)
 
-        # Act & Assert
-        for level in valid_levels:
-            config = LoggingConfig(level=level)
-            assert config.level == level
+        # Assert
+        assert config.level == level
 
     def test_accepts_lowercase_logging_levels(self) -> None:
         """Test that lowercase logging levels are handled correctly."""
@@ -210,70 +185,30 @@ class TestLoggingConfig:
 class TestApplicationConfig:
     """Test suite for ApplicationConfig aggregate."""
 
-    def test_creates_with_default_values(self) -> None:
-        """Test creating ApplicationConfig with default values."""
-        # Arrange & Act
-        config = ApplicationConfig()
-
-        # Assert
-        assert config.app_name == "pdf2markdown"
-        assert config.version == "1.0.0"
-        assert config.debug is False
-        assert isinstance(config.processing, ProcessingConfig)
-        assert isinstance(config.logging, LoggingConfig)
-        assert isinstance(config.working_directory, Path)
-        assert isinstance(config.temp_directory, Path)
-
-    def test_creates_with_custom_values(self) -> None:
-        """Test creating ApplicationConfig with custom values."""
-        # Arrange
-        custom_processing = ProcessingConfig(max_file_size_mb=50)
-        custom_logging = LoggingConfig(level="DEBUG")
-
-        # Act
-        config = ApplicationConfig(
-            app_name="test-app",
-            version="2.0.0",
-            debug=True,
-            processing=custom_processing,
-            logging=custom_logging
-        )
-
-        # Assert
-        assert config.app_name == "test-app"
-        assert config.version == "2.0.0"
-        assert config.debug is True
-        assert config.processing == custom_processing
-        assert config.logging == custom_logging
-
     def test_validates_app_name_not_empty(self) -> None:
         """Test validation that app_name cannot be empty."""
         # Arrange & Act & Assert
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match="app_name cannot be empty"):
             ApplicationConfig(app_name="")
 
-        assert "app_name cannot be empty" in str(exc_info.value)
-
     def test_validates_version_not_empty(self) -> None:
         """Test validation that version cannot be empty."""
         # Arrange & Act & Assert
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match="version cannot be empty"):
             ApplicationConfig(version="")
 
-        assert "version cannot be empty" in str(exc_info.value)
-
-    def test_sets_default_working_directory(self) -> None:
+    def test_sets_default_working_directory(self, default_app_config) -> None:
         """Test that default working directory is set to current directory."""
         # Arrange & Act
-        config = ApplicationConfig()
+        config = default_app_config
 
         # Assert
         assert config.working_directory == Path.cwd()
 
-    def test_sets_default_temp_directory(self) -> None:
+    def test_sets_default_temp_directory(self, default_app_config) -> None:
         """Test that default temp directory is set to system temp."""
         # Arrange & Act
-        config = ApplicationConfig()
+        config = default_app_config
 
         # Assert
         assert config.temp_directory is not None
@@ -285,15 +220,23 @@ class TestApplicationConfig:
         non_existent_path = Path("/path/that/does/not/exist")
 
         # Act & Assert
-        with pytest.raises(ConfigurationError) as exc_info:
+        with pytest.raises(ConfigurationError, match="Working directory does not exist"):
             ApplicationConfig(working_directory=non_existent_path)
 
-        assert "Working directory does not exist" in str(exc_info.value)
-
 
+@pytest.mark.xdist_group("configuration_manager")
 class TestConfigurationManager:
     """Test suite for ConfigurationManager singleton."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_singleton(self):
+        """Give every test a fresh ConfigurationManager and restore it afterwards."""
+        ConfigurationManager._instance = None
+        ConfigurationManager._config = None
+        yield
+        ConfigurationManager._instance = None
+        ConfigurationManager._config = None
+
     def test_singleton_behavior(self) -> None:
         """Test that ConfigurationManager implements singleton pattern."""
         # Arrange & Act
@@ -314,34 +257,30 @@ class TestConfigurationManager:
         # Assert
         assert isinstance(config, ApplicationConfig)
 
-    @patch.dict(os.environ, {
-        "PDF2MD_MAX_FILE_SIZE_MB": "200",
-        "PDF2MD_TIMEOUT": "600",
-        "PDF2MD_MEMORY_LIMIT_MB": "1024",
-        "PDF2MD_EXTRACT_TABLES": "false",
-        "PDF2MD_EXTRACT_IMAGES": "true",
-        "PDF2MD_PRESERVE_FORMATTING": "false",
-        "PDF2MD_MARKDOWN_DIALECT": "commonmark",
-        "PDF2MD_INCLUDE_METADATA": "false",
-        "PDF2MD_WRAP_LINES": "false",
-        "PDF2MD_LINE_LENGTH": "120",
-        "PDF2MD_LOG_LEVEL": "DEBUG",
-        "PDF2MD_FILE_LOGGING": "true",
-        "PDF2MD_LOG_FILE": "/tmp/test.log",
-        "PDF2MD_LOG_FILE_SIZE_MB": "5",
-        "PDF2MD_LOG_BACKUP_COUNT": "2",
-        "PDF2MD_DEBUG": "true",
-    })
     def test_loads_configuration_from_environment(self) -> None:
         """Test loading configuration from environment variables."""
         # Arrange
-        # Clear singleton to force reload
-        ConfigurationManager._instance = None
-        ConfigurationManager._config = None
+        env = {
+            "PDF2MD_MAX_FILE_SIZE_MB": "200",
+            "PDF2MD_TIMEOUT": "600",
+            "PDF2MD_MEMORY_LIMIT_MB": "1024",
+            "PDF2MD_EXTRACT_TABLES": "false",
+            "PDF2MD_EXTRACT_IMAGES": "true",
+            "PDF2MD_PRESERVE_FORMATTING": "false",
+            "PDF2MD_MARKDOWN_DIALECT": "commonmark",
+            "PDF2MD_INCLUDE_METADATA": "false",
+            "PDF2MD_WRAP_LINES": "false",
+            "PDF2MD_LINE_LENGTH": "120",
+            "PDF2MD_LOG_LEVEL": "DEBUG",
+            "PDF2MD_FILE_LOGGING": "true",
+            "PDF2MD_LOG_FILE": "/tmp/test.log",
+            "PDF2MD_LOG_FILE_SIZE_MB": "5",
+            "PDF2MD_LOG_BACKUP_COUNT": "2",
+            "PDF2MD_DEBUG": "true",
+        }
 
         # Act
-        manager = ConfigurationManager()
-        config = manager.get_config()
+        config = ConfigurationManager().load_configuration(env)
 
         # Assert
         assert config.processing.max_file_size_mb == 200
@@ -361,26 +300,42 @@ class TestConfigurationManager:
         assert config.logging.backup_count == 2
         assert config.debug is True
 
-    @patch.dict(os.environ, {
-        "PDF2MD_MAX_FILE_SIZE_MB": "invalid",
-        "PDF2MD_EXTRACT_TABLES": "invalid",
-    })
+    def test_reads_process_environment_by_default(self, monkeypatch) -> None:
+        """Test that os.environ is used when no mapping is passed."""
+        # Arrange
+        monkeypatch.setenv("PDF2MD_LINE_LENGTH", "100")
+
+        # Act
+        config = ConfigurationManager().get_config()
+
+        # Assert
+        assert config.processing.line_length == 100
+
+    def test_load_configuration_leaves_cached_config_unchanged(self) -> None:
+        """Test that loading an explicit mapping does not replace the singleton's config."""
+        # Arrange
+        manager = ConfigurationManager()
+        cached = manager.get_config()
+
+        # Act
+        loaded = manager.load_configuration({"PDF2MD_LINE_LENGTH": "100"})
+
+        # Assert
+        assert loaded.processing.line_length == 100
+        assert manager.get_config() is cached
+        assert ConfigurationManager().get_config() is cached
+
     def test_handles_invalid_environment_values(self) -> None:
         """Test handling of invalid environment variable values."""
         # Arrange
-        # Clear singleton to force reload
-        ConfigurationManager._instance = None
-        ConfigurationManager._config = None
+        env = {
+            "PDF2MD_MAX_FILE_SIZE_MB": "invalid",
+            "PDF2MD_EXTRACT_TABLES": "invalid",
+        }
 
         # Act
-        manager = ConfigurationManager()
-        config = manager.get_config()
+        config = ConfigurationManager().load_configuration(env)
 
         # Assert - should fall back to defaults for invalid values
         assert config.processing.max_file_size_mb == 100  # default
         assert config.processing.extract_tables is True  # default
-
-    def teardown_method(self) -> None:
-        """Reset singleton after each test."""
-        ConfigurationManager._instance = None
-        ConfigurationManager._config = None
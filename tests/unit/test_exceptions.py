@@ -5,48 +5,105 @@ Tests the exception hierarchy and error handling functionality
 following the AAA (Arrange, Act, Assert) pattern.
 """
 
+import pytest
+
 from pdf2markdown.core.exceptions import ConfigurationError
+from pdf2markdown.core.exceptions import ErrorCode
 from pdf2markdown.core.exceptions import FileSystemError
 from pdf2markdown.core.exceptions import InvalidPdfError
 from pdf2markdown.core.exceptions import PdfToMarkdownError
 from pdf2markdown.core.exceptions import ProcessingError
 from pdf2markdown.core.exceptions import ValidationError
 
-
-class TestPdfToMarkdownError:
-    """Test suite for base PdfToMarkdownError class."""
-
-    def test_creates_error_with_message_only(self) -> None:
-        """Test creating error with just a message."""
+# Parametrize tables hold exception classes and constructor arguments, never
+# exception instances: pytest keeps argvalues alive for the whole session, so a
+# raised instance would pin its __traceback__ (and every frame it references).
+# Build the instance inside the test, and wrap any pytest.raises in a lambda.
+
+# Exception class and the error_code it reports when given only a message
+MESSAGE_ONLY_CASES = [
+    pytest.param(PdfToMarkdownError, "PdfToMarkdownError", id="PdfToMarkdownError"),
+    pytest.param(ValidationError, "VALIDATION_ERROR", id="ValidationError"),
+    pytest.param(InvalidPdfError, "INVALID_PDF", id="InvalidPdfError"),
+    pytest.param(ProcessingError, "PROCESSING_ERROR", id="ProcessingError"),
+    pytest.param(FileSystemError, "FILESYSTEM_ERROR", id="FileSystemError"),
+    pytest.param(ConfigurationError, "CONFIGURATION_ERROR", id="ConfigurationError"),
+]
+
+# Exception class, extra constructor arguments, expected error_code and details
+WITH_DETAILS_CASES = [
+    pytest.param(
+        PdfToMarkdownError,
+        ("TEST_ERROR", {"key": "value", "number": 42}),
+        "TEST_ERROR",
+        {"key": "value", "number": 42},
+        id="PdfToMarkdownError.all",
+    ),
+    pytest.param(
+        ValidationError, ("email",), "VALIDATION_ERROR", {"field": "email"},
+        id="ValidationError.field",
+    ),
+    pytest.param(
+        InvalidPdfError, ("/path/to/file.pdf",), "INVALID_PDF",
+        {"file_path": "/path/to/file.pdf"},
+        id="InvalidPdfError.file_path",
+    ),
+    pytest.param(
+        ProcessingError, ("text_extraction", "/path/to/document.pdf"), "PROCESSING_ERROR",
+        {"stage": "text_extraction", "file_path": "/path/to/document.pdf"},
+        id="ProcessingError.stage_and_file",
+    ),
+    pytest.param(
+        FileSystemError, ("read", "/path/to/file.pdf"), "FILESYSTEM_ERROR",
+        {"operation": "read", "file_path": "/path/to/file.pdf"},
+        id="FileSystemError.operation_and_file",
+    ),
+    pytest.param(
+        ConfigurationError, ("api_key",), "CONFIGURATION_ERROR", {"config_key": "api_key"},
+        id="ConfigurationError.config_key",
+    ),
+]
+
+SUBCLASSES = [
+    pytest.param(cls, id=cls.__name__)
+    for cls in (ValidationError, InvalidPdfError, ProcessingError, FileSystemError, ConfigurationError)
+]
+
+
+class TestExceptionConstruction:
+    """Test suite for constructing the exception hierarchy."""
+
+    @pytest.mark.parametrize("error_cls, expected_code", MESSAGE_ONLY_CASES)
+    def test_creates_error_with_message_only(self, error_cls, expected_code) -> None:
+        """Test creating each error with just a message."""
         # Arrange
         message = "Test error message"
 
         # Act
-        error = PdfToMarkdownError(message)
+        error = error_cls(message)
 
         # Assert
         assert str(error) == message
         assert error.message == message
-        assert error.error_code == "PdfToMarkdownError"
+        assert error.error_code == expected_code
         assert error.details == {}
 
-    def test_creates_error_with_all_parameters(self) -> None:
-        """Test creating error with all parameters."""
+    @pytest.mark.parametrize("error_cls, extra_args, expected_code, expected_details", WITH_DETAILS_CASES)
+    def test_creates_error_with_details(self, error_cls, extra_args, expected_code, expected_details) -> None:
+        """Test creating each error with its additional context arguments."""
         # Arrange
         message = "Test error"
-        error_code = "TEST_ERROR"
-        details = {"key": "value", "number": 42}
 
         # Act
-        error = PdfToMarkdownError(message, error_code, details)
+        error = error_cls(message, *extra_args)
 
         # Assert
         assert str(error) == message
         assert error.message == message
-        assert error.error_code == error_code
-        assert error.details == details
+        assert error.error_code == expected_code
+        assert error.details == expected_details
 
-    def test_inherits_from_exception(self) -> None:
+    def test_base_error_inherits_from_exception(self) -> None:
         """Test that PdfToMarkdownError inherits from Exception."""
         # Arrange & Act
         error = PdfToMarkdownError("test")
@@ -54,178 +111,33 @@ class TestPdfToMarkdownError:
         # Assert
         assert isinstance(error, Exception)
 
-
-class TestValidationError:
-    """Test suite for ValidationError class."""
-
-    def test_creates_validation_error_with_message(self) -> None:
-        """Test creating validation error with message only."""
-        # Arrange
-        message = "Validation failed"
-
-        # Act
-        error = ValidationError(message)
-
-        # Assert
-        assert str(error) == message
-        assert error.message == message
-        assert error.error_code == "VALIDATION_ERROR"
-        assert error.details == {}
-
-    def test_creates_validation_error_with_field(self) -> None:
-        """Test creating validation error with field information."""
-        # Arrange
-        message = "Invalid value"
-        field = "email"
-
-        # Act
-        error = ValidationError(message, field)
-
-        # Assert
-        assert str(error) == message
-        assert error.message == message
-        assert error.error_code == "VALIDATION_ERROR"
-        assert error.details == {"field": field}
-
-    def test_inherits_from_pdf_to_markdown_error(self) -> None:
+    @pytest.mark.parametrize("error_cls", SUBCLASSES)
+    def test_inherits_from_pdf_to_markdown_error(self, error_cls) -> None:
         """Test inheritance hierarchy."""
         # Arrange & Act
-        error = ValidationError("test")
+        error = error_cls("test")
 
         # Assert
         assert isinstance(error, PdfToMarkdownError)
         assert isinstance(error, Exception)
 
 
-class TestInvalidPdfError:
-    """Test suite for InvalidPdfError class."""
-
-    def test_creates_pdf_error_with_message(self) -> None:
-        """Test creating PDF error with message only."""
-        # Arrange
-        message = "Invalid PDF file"
-
-        # Act
-        error = InvalidPdfError(message)
-
-        # Assert
-        assert str(error) == message
-        assert error.message == message
-        assert error.error_code == "INVALID_PDF"
-        assert error.details == {}
-
-    def test_creates_pdf_error_with_file_path(self) -> None:
-        """Test creating PDF error with file path."""
-        # Arrange
-        message = "Corrupted PDF"
-        file_path = "/path/to/file.pdf"
-
-        # Act
-        error = InvalidPdfError(message, file_path)
-
-        # Assert
-        assert str(error) == message
-        assert error.message == message
-        assert error.error_code == "INVALID_PDF"
-        assert error.details == {"file_path": file_path}
-
-
-class TestProcessingError:
-    """Test suite for ProcessingError class."""
-
-    def test_creates_processing_error_with_message(self) -> None:
-        """Test creating processing error with message only."""
-        # Arrange
-        message = "Processing failed"
-
-        # Act
-        error = ProcessingError(message)
-
-        # Assert
-        assert str(error) == message
-        assert error.message == message
-        assert error.error_code == "PROCESSING_ERROR"
-        assert error.details == {}
-
-    def test_creates_processing_error_with_stage_and_file(self) -> None:
-        """Test creating processing error with stage and file information."""
-        # Arrange
-        message = "Failed at parsing stage"
-        stage = "text_extraction"
-        file_path = "/path/to/document.pdf"
-
-        # Act
-        error = ProcessingError(message, stage, file_path)
-
-        # Assert
-        assert str(error) == message
-        assert error.message == message
-        assert error.error_code == "PROCESSING_ERROR"
-        assert error.details == {"stage": stage, "file_path": file_path}
-
-
-class TestFileSystemError:
-    """Test suite for FileSystemError class."""
-
-    def test_creates_filesystem_error_with_message(self) -> None:
-        """Test creating filesystem error with message only."""
-        # Arrange
-        message = "File not found"
-
-        # Act
-        error = FileSystemError(message)
-
-        # Assert
-        assert str(error) == message
-        assert error.message == message
-        assert error.error_code == "FILESYSTEM_ERROR"
-        assert error.details == {}
-
-    def test_creates_filesystem_error_with_operation_and_file(self) -> None:
-        """Test creating filesystem error with operation details."""
-        # Arrange
-        message = "Read operation failed"
-        operation = "read"
-        file_path = "/path/to/file.pdf"
-
-        # Act
-        error = FileSystemError(message, operation, file_path)
-
-        # Assert
-        assert str(error) == message
-        assert error.message == message
-        assert error.error_code == "FILESYSTEM_ERROR"
-        assert error.details == {"operation": operation, "file_path": file_path}
-
-
-class TestConfigurationError:
-    """Test suite for ConfigurationError class."""
-
-    def test_creates_configuration_error_with_message(self) -> None:
-        """Test creating configuration error with message only."""
-        # Arrange
-        message = "Invalid configuration"
+class TestValidationError:
+    """Test suite for ValidationError error codes."""
 
-        # Act
-        error = ConfigurationError(message)
+    def test_defaults_code_to_none(self) -> None:
+        """Test that a message-only validation error carries no code."""
+        # Arrange & Act
+        error = ValidationError("Validation failed")
 
         # Assert
-        assert str(error) == message
-        assert error.message == message
-        assert error.error_code == "CONFIGURATION_ERROR"
-        assert error.details == {}
+        assert error.code is None
 
-    def test_creates_configuration_error_with_config_key(self) -> None:
-        """Test creating configuration error with config key."""
-        # Arrange
-        message = "Missing required setting"
-        config_key = "api_key"
-
-        # Act
-        error = ConfigurationError(message, config_key)
+    def test_creates_validation_error_with_code(self) -> None:
+        """Test creating validation error with a structured error code."""
+        # Arrange & Act
+        error = ValidationError("must be positive", "line_length", ErrorCode.POSITIVE_REQUIRED)
 
         # Assert
-        assert str(error) == message
-        assert error.message == message
-        assert error.error_code == "CONFIGURATION_ERROR"
-        assert error.details == {"config_key": config_key}
+        assert error.code is ErrorCode.POSITIVE_REQUIRED
+        assert error.details == {"field": "line_length"}
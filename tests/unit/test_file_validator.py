@@ -5,17 +5,89 @@ Tests file validation logic, security checks, and error handling
 following the AAA pattern with comprehensive security test coverage.
 """
 
-import tempfile
+import io
+import os
+import stat
 from pathlib import Path
-from unittest.mock import Mock
-from unittest.mock import patch
+from typing import NamedTuple
+from typing import Tuple
 
+import pytest
+
+from pdf2markdown.core import file_validator
 from pdf2markdown.core.config import ApplicationConfig
 from pdf2markdown.core.config import ProcessingConfig
 from pdf2markdown.core.file_validator import FileValidationResult
 from pdf2markdown.core.file_validator import FileValidator
 from pdf2markdown.core.file_validator import create_file_validator
 
+# Sample file contents shared by the on-disk and in-memory tests
+_VALID_PDF = b"%PDF-1.4\nHello PDF\n%EOF\n"
+_VERSIONED_PDF = b"%PDF-1.7\nContent\n%EOF\n"
+_INVALID_PDF = b"Not a PDF file"
+
+
+class _PathCase(NamedTuple):
+    """A disallowed path, the API that checks it and the message it must report."""
+
+    path: str
+    kind: str  # "pdf" for validate_pdf_file, "output" for validate_output_path
+    bucket: str  # "errors" or "warnings"
+    expected: str
+
+
+class _ExistingOutputCase(NamedTuple):
+    """A force flag and how validating an existing output file must turn out."""
+
+    force: bool
+    expected_valid: bool
+    bucket: str  # "errors" or "warnings"
+    expected: Tuple[str, ...]
+
+
+@pytest.fixture(scope="session")
+def valid_pdf(tmp_path_factory) -> Path:
+    """Write one real valid PDF once per session for tests that need the disk."""
+    path = tmp_path_factory.mktemp("samples") / "valid.pdf"
+    path.write_bytes(_VALID_PDF)
+    return path
+
+
+@pytest.fixture
+def fake_pdf(monkeypatch, tmp_path):
+    """Serve the given bytes as a readable file under tmp_path without writing it.
+
+    Only the returned absolute path is faked: the Path, os.access and open
+    calls the validator makes fall through to the real implementations for
+    every other path.
+    """
+    def _install(name: str, content: bytes) -> Path:
+        fake_path = tmp_path / name
+        fake_stat = os.stat_result((stat.S_IFREG | 0o644, 0, 0, 1, 0, 0, len(content), 0, 0, 0))
+
+        def fake(real, value):
+            def patched(path, *args, **kwargs):
+                if Path(path) == fake_path:
+                    return value(*args, **kwargs)
+                return real(path, *args, **kwargs)
+            return patched
+
+        monkeypatch.setattr(Path, "exists", fake(Path.exists, lambda *args, **kwargs: True))
+        monkeypatch.setattr(Path, "is_file", fake(Path.is_file, lambda *args, **kwargs: True))
+        monkeypatch.setattr(Path, "stat", fake(Path.stat, lambda *args, **kwargs: fake_stat))
+        monkeypatch.setattr(os, "access", fake(os.access, lambda *args, **kwargs: True))
+        monkeypatch.setattr(file_validator, "open", fake(open, lambda *args, **kwargs: io.BytesIO(content)), raising=False)
+        return fake_path
+    return _install
+
+
+@pytest.fixture(scope="module")
+def validator() -> FileValidator:
+    """Provide one FileValidator with a 10MB size limit; validation never mutates it."""
+    return FileValidator(
+        ApplicationConfig(processing=ProcessingConfig(max_file_size_mb=10))
+    )
+
 
 class TestFileValidationResult:
     """Test suite for FileValidationResult value object."""
@@ -62,327 +134,252 @@ class TestFileValidationResult:
         assert result.errors == errors
         assert result.warnings == warnings
 
-    def test_add_error_invalidates_result(self) -> None:
-        """Test that adding error invalidates the result."""
+    @pytest.mark.parametrize("initial_valid, ops, expected_valid, expected_warnings, expected_summary", [
+        pytest.param(True, [], True, [], "No errors", id="no_errors"),
+        pytest.param(True, [("error", "New error")], False, [], "New error", id="error_invalidates"),
+        pytest.param(True, [("warning", "New warning")], True, ["New warning"], "No errors", id="warning_keeps_valid"),
+        pytest.param(
+            False, [("error", "First error"), ("error", "Second error")], False, [],
+            "First error; Second error",
+            id="multiple_errors",
+        ),
+    ])
+    def test_result_state(self, initial_valid, ops, expected_valid, expected_warnings, expected_summary) -> None:
+        """Test validity, warnings and error summary after adding errors and warnings."""
         # Arrange
-        result = FileValidationResult(is_valid=True, file_path=Path("test.pdf"))
+        result = FileValidationResult(is_valid=initial_valid, file_path=Path("test.pdf"))
 
         # Act
-        result.add_error("New error")
+        for kind, message in ops:
+            (result.add_error if kind == "error" else result.add_warning)(message)
 
         # Assert
-        assert result.is_valid is False
-        assert "New error" in result.errors
-
-    def test_add_warning_preserves_validity(self) -> None:
-        """Test that adding warning preserves validity."""
-        # Arrange
-        result = FileValidationResult(is_valid=True, file_path=Path("test.pdf"))
-
-        # Act
-        result.add_warning("New warning")
-
-        # Assert
-        assert result.is_valid is True
-        assert "New warning" in result.warnings
-
-    def test_get_error_summary_with_no_errors(self) -> None:
-        """Test error summary when no errors exist."""
-        # Arrange
-        result = FileValidationResult(is_valid=True, file_path=Path("test.pdf"))
-
-        # Act
-        summary = result.get_error_summary()
-
-        # Assert
-        assert summary == "No errors"
-
-    def test_get_error_summary_with_multiple_errors(self) -> None:
-        """Test error summary with multiple errors."""
-        # Arrange
-        result = FileValidationResult(is_valid=False, file_path=Path("test.pdf"))
-        result.add_error("First error")
-        result.add_error("Second error")
-
-        # Act
-        summary = result.get_error_summary()
-
-        # Assert
-        assert summary == "First error; Second error"
+        assert result.is_valid is expected_valid
+        assert result.warnings == expected_warnings
+        assert result.get_error_summary() == expected_summary
 
 
 class TestFileValidator:
     """Test suite for FileValidator service."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.config = ApplicationConfig(
-            processing=ProcessingConfig(max_file_size_mb=10)
-        )
-        self.validator = FileValidator(self.config)
-
-        # Create temporary directory and files for testing
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-        # Create valid PDF file
-        self.valid_pdf = self.temp_dir / "valid.pdf"
-        self.valid_pdf.write_bytes(b"%PDF-1.4\nHello PDF\n%EOF\n")
-
-        # Create invalid PDF file (wrong header)
-        self.invalid_pdf = self.temp_dir / "invalid.pdf"
-        self.invalid_pdf.write_bytes(b"Not a PDF file")
-
-        # Create empty PDF file
-        self.empty_pdf = self.temp_dir / "empty.pdf"
-        self.empty_pdf.write_bytes(b"")
-
-        # Create non-PDF file
-        self.text_file = self.temp_dir / "document.txt"
-        self.text_file.write_text("This is not a PDF")
-
-    def teardown_method(self) -> None:
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_validates_existing_pdf_file(self) -> None:
+    def test_validates_existing_pdf_file(self, fake_pdf, validator) -> None:
         """Test validation of existing valid PDF file."""
-        # Arrange & Act
-        result = self.validator.validate_pdf_file(self.valid_pdf)
+        # Arrange
+        pdf_path = fake_pdf("valid.pdf", _VALID_PDF)
+
+        # Act
+        result = validator.validate_pdf_file(pdf_path)
 
         # Assert
         assert result.is_valid is True
-        assert result.file_path == self.valid_pdf
+        assert result.file_path == pdf_path
         assert len(result.errors) == 0
         assert result.file_size > 0
 
-    def test_validates_nonexistent_file(self) -> None:
+    def test_validates_nonexistent_file(self, valid_pdf, validator) -> None:
         """Test validation of non-existent file."""
-        # Arrange
-        nonexistent_file = self.temp_dir / "nonexistent.pdf"
+        # Arrange - Reuse the session sample directory instead of creating one
+        nonexistent_file = valid_pdf.parent / "nonexistent.pdf"
 
         # Act
-        result = self.validator.validate_pdf_file(nonexistent_file)
+        result = validator.validate_pdf_file(nonexistent_file)
 
         # Assert
         assert result.is_valid is False
         assert any("File not found" in error for error in result.errors)
 
-    def test_validates_directory_as_file(self) -> None:
+    def test_validates_directory_as_file(self, tmp_path, validator) -> None:
         """Test validation when directory is provided instead of file."""
         # Arrange
-        directory = self.temp_dir / "directory.pdf"
+        directory = tmp_path / "directory.pdf"
         directory.mkdir()
 
         # Act
-        result = self.validator.validate_pdf_file(directory)
+        result = validator.validate_pdf_file(directory)
 
         # Assert
         assert result.is_valid is False
         assert any("Not a regular file" in error for error in result.errors)
 
-    def test_validates_file_extension(self) -> None:
+    def test_validates_file_extension(self, fake_pdf, validator) -> None:
         """Test validation of file extension."""
-        # Arrange & Act
-        result = self.validator.validate_pdf_file(self.text_file)
+        # Arrange
+        pdf_path = fake_pdf("document.txt", b"This is not a PDF")
+
+        # Act
+        result = validator.validate_pdf_file(pdf_path)
 
         # Assert
         assert result.is_valid is False
         assert any("must have .pdf extension" in error for error in result.errors)
 
-    def test_validates_empty_file(self) -> None:
+    def test_validates_empty_file(self, fake_pdf, validator) -> None:
         """Test validation of empty file."""
-        # Arrange & Act
-        result = self.validator.validate_pdf_file(self.empty_pdf)
+        # Arrange
+        pdf_path = fake_pdf("empty.pdf", b"")
+
+        # Act
+        result = validator.validate_pdf_file(pdf_path)
 
         # Assert
         assert result.is_valid is False
         assert any("File is empty" in error for error in result.errors)
 
-    def test_validates_file_size_limit(self) -> None:
+    def test_validates_file_size_limit(self, monkeypatch, valid_pdf, validator) -> None:
         """Test validation of file size limits."""
-        # Arrange - Create file larger than limit
-        large_pdf = self.temp_dir / "large.pdf"
-        large_size = self.config.processing.max_file_size_mb * 1024 * 1024 + 1
+        # Arrange - Report the valid PDF as one byte over the limit without writing it
+        large_size = validator._config.processing.max_file_size_mb * 1024 * 1024 + 1
+        real_stat = Path.stat
+
+        def oversized_stat(path, *args, **kwargs):
+            result = real_stat(path, *args, **kwargs)
+            if path != valid_pdf:
+                return result
+            fields = list(result)
+            fields[stat.ST_SIZE] = large_size
+            return os.stat_result(fields)
 
-        with open(large_pdf, 'wb') as f:
-            f.write(b"%PDF-1.4\n")
-            f.seek(large_size - 1)
-            f.write(b"\0")
+        monkeypatch.setattr(Path, "stat", oversized_stat)
 
         # Act
-        result = self.validator.validate_pdf_file(large_pdf)
+        result = validator.validate_pdf_file(valid_pdf)
 
         # Assert
         assert result.is_valid is False
         assert any("exceeds limit" in error for error in result.errors)
 
-    def test_validates_pdf_header(self) -> None:
+    def test_validates_pdf_header(self, fake_pdf, validator) -> None:
         """Test validation of PDF file header."""
-        # Arrange & Act
-        result = self.validator.validate_pdf_file(self.invalid_pdf)
+        # Arrange
+        pdf_path = fake_pdf("invalid.pdf", _INVALID_PDF)
+
+        # Act
+        result = validator.validate_pdf_file(pdf_path)
 
         # Assert
         assert result.is_valid is False
         assert any("does not appear to be a valid PDF" in error for error in result.errors)
 
-    def test_detects_pdf_version(self) -> None:
+    def test_detects_pdf_version(self, fake_pdf, validator) -> None:
         """Test detection of PDF version from header."""
         # Arrange
-        versioned_pdf = self.temp_dir / "versioned.pdf"
-        versioned_pdf.write_bytes(b"%PDF-1.7\nContent\n%EOF\n")
+        pdf_path = fake_pdf("versioned.pdf", _VERSIONED_PDF)
 
         # Act
-        result = self.validator.validate_pdf_file(versioned_pdf)
+        result = validator.validate_pdf_file(pdf_path)
 
         # Assert
         assert result.is_valid is True
         # Should have warning about PDF version
         assert any("PDF version" in warning for warning in result.warnings)
 
-    @patch('os.access')
-    def test_validates_file_permissions(self, mock_access: Mock) -> None:
+    def test_validates_file_permissions(self, monkeypatch, valid_pdf, validator) -> None:
         """Test validation of file read permissions."""
         # Arrange
-        mock_access.return_value = False
+        monkeypatch.setattr(os, "access", lambda path, mode: False)
 
         # Act
-        result = self.validator.validate_pdf_file(self.valid_pdf)
+        result = validator.validate_pdf_file(valid_pdf)
 
         # Assert
         assert result.is_valid is False
         assert any("not readable" in error for error in result.errors)
 
-    def test_validates_security_path_traversal(self) -> None:
-        """Test security validation for path traversal attempts."""
+    @pytest.mark.parametrize("case", [
+        pytest.param(_PathCase("../../../etc/passwd.pdf", "pdf", "warnings", "'..' components"), id="pdf_traversal"),
+        pytest.param(
+            _PathCase("/etc/passwd.pdf", "pdf", "errors", "Access to system directory not allowed"),
+            id="pdf_system_dir",
+        ),
+        pytest.param(
+            _PathCase("/etc/malicious.md", "output", "errors", "Cannot write to system directory"),
+            id="output_system_dir",
+        ),
+        pytest.param(
+            _PathCase("/nonexistent/directory/output.md", "output", "errors", "directory does not exist"),
+            id="output_missing_dir",
+        ),
+    ])
+    def test_disallowed_paths(self, validator, case) -> None:
+        """Test that traversal, system and missing-directory paths are rejected."""
         # Arrange
-        traversal_path = Path("../../../etc/passwd.pdf")
+        validate = validator.validate_pdf_file if case.kind == "pdf" else validator.validate_output_path
 
         # Act
-        result = self.validator.validate_pdf_file(traversal_path)
+        result = validate(Path(case.path))
 
         # Assert
-        # File won't exist, but should also have security warning
         assert result.is_valid is False
-        assert any("'..' components" in warning for warning in result.warnings)
-
-    def test_validates_system_directory_access(self) -> None:
-        """Test prevention of access to system directories."""
-        # Arrange
-        system_file = Path("/etc/passwd.pdf")
-
-        # Act
-        result = self.validator.validate_pdf_file(system_file)
+        assert any(case.expected in message for message in getattr(result, case.bucket))
 
-        # Assert
-        assert result.is_valid is False
-        # Should fail due to file not existing, but would also fail security check
-
-    def test_validates_output_path_writable_directory(self) -> None:
+    def test_validates_output_path_writable_directory(self, valid_pdf, validator) -> None:
         """Test validation of output path with writable directory."""
         # Arrange
-        output_path = self.temp_dir / "output.md"
+        output_path = valid_pdf.parent / "output.md"
 
         # Act
-        result = self.validator.validate_output_path(output_path)
+        result = validator.validate_output_path(output_path)
 
         # Assert
         assert result.is_valid is True
         assert len(result.errors) == 0
 
-    def test_validates_output_path_nonexistent_directory(self) -> None:
-        """Test validation of output path with non-existent directory."""
-        # Arrange
-        output_path = Path("/nonexistent/directory/output.md")
-
-        # Act
-        result = self.validator.validate_output_path(output_path)
-
-        # Assert
-        assert result.is_valid is False
-        assert any("directory does not exist" in error for error in result.errors)
-
-    @patch('os.access')
-    def test_validates_output_directory_permissions(self, mock_access: Mock) -> None:
+    def test_validates_output_directory_permissions(self, monkeypatch, valid_pdf, validator) -> None:
         """Test validation of output directory write permissions."""
         # Arrange
-        output_path = self.temp_dir / "output.md"
-        mock_access.return_value = False
+        output_path = valid_pdf.parent / "output.md"
+        monkeypatch.setattr(os, "access", lambda path, mode: False)
 
         # Act
-        result = self.validator.validate_output_path(output_path)
+        result = validator.validate_output_path(output_path)
 
         # Assert
         assert result.is_valid is False
         assert any("No write permission" in error for error in result.errors)
 
-    def test_validates_existing_output_file_without_force(self) -> None:
-        """Test validation of existing output file without force flag."""
-        # Arrange
-        existing_output = self.temp_dir / "existing.md"
-        existing_output.write_text("Existing content")
-
-        # Act
-        result = self.validator.validate_output_path(existing_output, force=False)
-
-        # Assert
-        assert result.is_valid is False
-        assert any("already exists" in error for error in result.errors)
-        assert any("--force" in error for error in result.errors)
-
-    def test_validates_existing_output_file_with_force(self) -> None:
-        """Test validation of existing output file with force flag."""
+    @pytest.mark.parametrize("case", [
+        pytest.param(_ExistingOutputCase(False, False, "errors", ("already exists", "--force")), id="without_force"),
+        pytest.param(_ExistingOutputCase(True, True, "warnings", ("Will overwrite",)), id="with_force"),
+    ])
+    def test_validates_existing_output_file(self, tmp_path, validator, case) -> None:
+        """Test validation of an existing output file with and without the force flag."""
         # Arrange
-        existing_output = self.temp_dir / "existing.md"
+        existing_output = tmp_path / "existing.md"
         existing_output.write_text("Existing content")
 
         # Act
-        result = self.validator.validate_output_path(existing_output, force=True)
+        result = validator.validate_output_path(existing_output, force=case.force)
 
         # Assert
-        assert result.is_valid is True
-        assert any("Will overwrite" in warning for warning in result.warnings)
+        assert result.is_valid is case.expected_valid
+        messages = getattr(result, case.bucket)
+        for substring in case.expected:
+            assert any(substring in message for message in messages)
 
-    @patch('os.access')
-    def test_validates_existing_output_file_permissions(self, mock_access: Mock) -> None:
+    def test_validates_existing_output_file_permissions(self, monkeypatch, tmp_path, validator) -> None:
         """Test validation of existing output file write permissions."""
         # Arrange
-        existing_output = self.temp_dir / "existing.md"
+        existing_output = tmp_path / "existing.md"
         existing_output.write_text("Existing content")
 
-        # Mock os.access to return False for the file, True for directory
-        def mock_access_func(path, mode):
-            return str(path) != str(existing_output)
-
-        mock_access.side_effect = mock_access_func
+        # Deny access to the file, allow it for the directory
+        monkeypatch.setattr(os, "access", lambda path, mode: str(path) != str(existing_output))
 
         # Act
-        result = self.validator.validate_output_path(existing_output, force=True)
+        result = validator.validate_output_path(existing_output, force=True)
 
         # Assert
         assert result.is_valid is False
         assert any("No write permission for file" in error for error in result.errors)
 
-    def test_validates_output_security_system_directory(self) -> None:
-        """Test security validation for output to system directories."""
-        # Arrange
-        system_output = Path("/etc/malicious.md")
-
-        # Act
-        result = self.validator.validate_output_path(system_output)
-
-        # Assert
-        assert result.is_valid is False
-        assert any("Cannot write to system directory" in error for error in result.errors)
-
-    def test_handles_validation_exceptions_gracefully(self) -> None:
+    def test_handles_validation_exceptions_gracefully(self, validator) -> None:
         """Test graceful handling of validation exceptions."""
         # Arrange
         # Create a path that will cause an OSError
         problematic_path = Path("/dev/null/impossible.pdf")
 
         # Act
-        result = self.validator.validate_pdf_file(problematic_path)
+        result = validator.validate_pdf_file(problematic_path)
 
         # Assert
         assert result.is_valid is False
@@ -7,100 +7,56 @@ can be executed correctly with `python -m pdf2markdown`.
 
 import sys
 from unittest.mock import MagicMock
-from unittest.mock import patch
+from unittest.mock import create_autospec
 
 import pytest
 
+from pdf2markdown import __main__ as main_mod
 from pdf2markdown.__main__ import main
+from pdf2markdown.cli.main import PdfToMarkdownCli
+
+
+@pytest.fixture(scope="module")
+def cli_cls():
+    """Provide one autospec of PdfToMarkdownCli for the module."""
+    return create_autospec(PdfToMarkdownCli)
+
+
+@pytest.fixture
+def main_env(monkeypatch, cli_cls):
+    """Install the CLI autospec and a sys.exit mock, and provide a helper to set argv."""
+    cli_cls.reset_mock()
+    mock_exit = MagicMock()
+    monkeypatch.setattr(main_mod, 'PdfToMarkdownCli', cli_cls)
+    monkeypatch.setattr(sys, 'exit', mock_exit)
+
+    def set_argv(tail):
+        monkeypatch.setattr(sys, 'argv', ['pdf2markdown', *tail])
+
+    return cli_cls, mock_exit, set_argv
 
 
 class TestMainModule:
     """Test suite for __main__.py module execution."""
 
-    @patch('pdf2markdown.__main__.PdfToMarkdownCli')
-    @patch('sys.exit')
-    def test_main_creates_cli_and_runs_with_args(self, mock_exit: MagicMock, mock_cli_class: MagicMock) -> None:
-        """Test that main() creates CLI instance and runs with command line args."""
+    @pytest.mark.parametrize("tail, rc", [
+        pytest.param([], 2, id="empty"),
+        pytest.param(['--help'], 0, id="help"),
+        pytest.param(['--version'], 0, id="version"),
+        pytest.param(['test.pdf', '--output', 'test.md'], 0, id="convert"),
+        pytest.param(['nonexistent.pdf'], 2, id="missing"),
+    ])
+    def test_main_runs_cli_and_exits_with_its_code(self, main_env, tail, rc) -> None:
+        """Test that main() passes argv to the CLI and exits with its return code."""
         # Arrange
-        mock_cli_instance = MagicMock()
-        mock_cli_class.return_value = mock_cli_instance
-        mock_cli_instance.run.return_value = 0
-        
-        test_args = ['test.pdf', '--output', 'test.md']
-        
-        with patch.object(sys, 'argv', ['pdf2markdown'] + test_args):
-            # Act
-            main()
-        
-        # Assert
-        mock_cli_class.assert_called_once()
-        mock_cli_instance.run.assert_called_once_with(test_args)
-        mock_exit.assert_called_once_with(0)
+        mock_cli_class, mock_exit, set_argv = main_env
+        mock_cli_class.return_value.run.return_value = rc
+        set_argv(tail)
 
-    @patch('pdf2markdown.__main__.PdfToMarkdownCli')
-    @patch('sys.exit')
-    def test_main_exits_with_cli_return_code(self, mock_exit: MagicMock, mock_cli_class: MagicMock) -> None:
-        """Test that main() exits with the return code from CLI."""
-        # Arrange
-        mock_cli_instance = MagicMock()
-        mock_cli_class.return_value = mock_cli_instance
-        mock_cli_instance.run.return_value = 2  # Error exit code
-        
-        with patch.object(sys, 'argv', ['pdf2markdown', 'nonexistent.pdf']):
-            # Act
-            main()
-        
-        # Assert
-        mock_exit.assert_called_once_with(2)
+        # Act
+        main()
 
-    @patch('pdf2markdown.__main__.PdfToMarkdownCli')
-    @patch('sys.exit')
-    def test_main_handles_empty_args(self, mock_exit: MagicMock, mock_cli_class: MagicMock) -> None:
-        """Test that main() handles empty command line arguments."""
-        # Arrange
-        mock_cli_instance = MagicMock()
-        mock_cli_class.return_value = mock_cli_instance
-        mock_cli_instance.run.return_value = 2  # Error for missing args
-        
-        with patch.object(sys, 'argv', ['pdf2markdown']):
-            # Act
-            main()
-        
         # Assert
         mock_cli_class.assert_called_once()
-        mock_cli_instance.run.assert_called_once_with([])
-        mock_exit.assert_called_once_with(2)
-
-    @patch('pdf2markdown.__main__.PdfToMarkdownCli')
-    @patch('sys.exit')
-    def test_main_passes_help_flag(self, mock_exit: MagicMock, mock_cli_class: MagicMock) -> None:
-        """Test that main() properly passes help flag to CLI."""
-        # Arrange
-        mock_cli_instance = MagicMock()
-        mock_cli_class.return_value = mock_cli_instance
-        mock_cli_instance.run.return_value = 0  # Success for help
-        
-        with patch.object(sys, 'argv', ['pdf2markdown', '--help']):
-            # Act
-            main()
-        
-        # Assert
-        mock_cli_instance.run.assert_called_once_with(['--help'])
-        mock_exit.assert_called_once_with(0)
-
-    @patch('pdf2markdown.__main__.PdfToMarkdownCli')
-    @patch('sys.exit')
-    def test_main_passes_version_flag(self, mock_exit: MagicMock, mock_cli_class: MagicMock) -> None:
-        """Test that main() properly passes version flag to CLI."""
-        # Arrange
-        mock_cli_instance = MagicMock()
-        mock_cli_class.return_value = mock_cli_instance
-        mock_cli_instance.run.return_value = 0  # Success for version
-        
-        with patch.object(sys, 'argv', ['pdf2markdown', '--version']):
-            # Act
-            main()
-        
-        # Assert
-        mock_cli_instance.run.assert_called_once_with(['--version'])
-        mock_exit.assert_called_once_with(0)
\ No newline at end of file
+        mock_cli_class.return_value.run.assert_called_once_with(tail)
+        mock_exit.assert_called_once_with(rc)